@@ -0,0 +1,56 @@
+"""Long-form Arrow view of ScraperFC per-category player stats."""
+
+from collections import Counter
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+def flat_column_names(columns) -> list:
+    """Flatten MultiIndex column tuples to their leaf names.
+
+    Leaves that repeat within a category (e.g. Tackles/Tkl and Challenges/Tkl)
+    keep their group as a prefix.
+    """
+    leaves = [c[-1] if isinstance(c, tuple) else str(c) for c in columns]
+    counts = Counter(leaves)
+    return [
+        f"{c[0]}_{leaf}" if counts[leaf] > 1 and isinstance(c, tuple) else leaf
+        for c, leaf in zip(columns, leaves)
+    ]
+
+
+def to_long_arrow(team_stats: dict, team: str) -> pa.Table:
+    """Concatenate a team's per-category stats into one Arrow table.
+
+    Args:
+        team_stats: ``{category: DataFrame}`` mapping (a Series of DataFrames also works) ("Summary", "Misc", ...)
+        team: Label stored in the ``team`` column
+
+    Returns:
+        Table with one row per player per category, plus ``category`` and
+        ``team`` columns; columns missing from a category are null. Empty
+        (no rows, only ``category`` and ``team``) when no category has data,
+        e.g. for an abandoned or unplayed match
+    """
+    tables = []
+    for category, df in team_stats.items():
+        if not isinstance(df, pd.DataFrame) or df.empty:
+            continue
+        flat = df.copy()
+        flat.columns = flat_column_names(df.columns)
+        t = pa.Table.from_pandas(flat, preserve_index=False)
+        t = t.append_column("category", pa.array([category] * len(t)))
+        t = t.append_column("team", pa.array([team] * len(t)))
+        tables.append(t)
+    if not tables:
+        return pa.table({"category": pa.array([], pa.string()), "team": pa.array([], pa.string())})
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def find_player(tbl: pa.Table, name: str, player_col: str = "Player") -> pa.Table:
+    """Return the rows whose player column contains ``name`` (none if the table has no such column)."""
+    if player_col not in tbl.column_names:
+        return tbl.slice(0, 0)
+    return tbl.filter(pc.match_substring(tbl[player_col], name))
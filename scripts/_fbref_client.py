@@ -0,0 +1,19 @@
+"""Process-wide ScraperFC client and scraper shared by the scripts."""
+
+from functools import lru_cache
+
+from ScraperFC import FBref
+
+from src.scrapers.fbref import FBrefScraper
+
+
+@lru_cache(maxsize=1)
+def get_fbref() -> FBref:
+    """Return the shared ScraperFC ``FBref`` instance, creating it on first use."""
+    return FBref()
+
+
+@lru_cache(maxsize=1)
+def get_scraper() -> FBrefScraper:
+    """Return the shared ``FBrefScraper``, whose disk cache and throttle every script scrape goes through."""
+    return FBrefScraper()
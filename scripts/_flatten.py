@@ -0,0 +1,62 @@
+"""Flatten ScraperFC's nested per-category player stats into one Parquet table."""
+
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from loguru import logger
+
+from scripts._arrow_stats import to_long_arrow
+
+TEAM_COLUMNS = {"home": "Home Player Stats", "away": "Away Player Stats"}
+
+
+def match_id_of(link: str) -> str:
+    """Extract the FBref match id from a match URL (.../matches/<id>/...)."""
+    parts = str(link).split("/")
+    return parts[parts.index("matches") + 1] if "matches" in parts else str(link)
+
+
+def flatten_match(result: pd.DataFrame) -> Optional[pa.Table]:
+    """Concatenate every (team, category) stats DataFrame of a match.
+
+    Args:
+        result: Match DataFrame from ``FBref.scrape_match``
+
+    Returns:
+        Arrow table with one row per player per category, plus ``match_id``,
+        ``team`` and ``category`` columns; None when the match has no player
+        stats (e.g. abandoned or unplayed)
+    """
+    row = result.iloc[0]
+    match_id = match_id_of(row.get("Link", ""))
+    tables = [to_long_arrow(row[col], team) for team, col in TEAM_COLUMNS.items() if col in result.columns]
+    tables = [t for t in tables if t.num_rows]
+    if not tables:
+        return None
+    tbl = pa.concat_tables(tables, promote_options="permissive")
+    return tbl.append_column("match_id", pa.array([match_id] * len(tbl)))
+
+
+def write_flat_match(result: pd.DataFrame, path: Path) -> bool:
+    """Write a match's flattened player stats to Parquet.
+
+    Returns:
+        False (and nothing is written) when the match has no player stats
+    """
+    tbl = flatten_match(result)
+    if tbl is None:
+        logger.warning(f"No player stats to flatten, skipping {path}")
+        return False
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    pq.write_table(tbl, path, compression="zstd", row_group_size=64_000)
+    return True
+
+
+def read_category(path: Path, category: str, columns: list = None) -> pa.Table:
+    """Load one stat category (optionally only some columns) from a flattened file."""
+    if columns is not None and "category" not in columns:
+        columns = ["category"] + list(columns)
+    return pq.read_table(path, columns=columns, filters=[("category", "=", category)])
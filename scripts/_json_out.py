@@ -0,0 +1,33 @@
+"""Indented JSON dumps of scraped records, via orjson when it is installed."""
+
+import json
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def write_json(data, path) -> Path:
+    """Write ``data`` as indented JSON, creating the parent directory.
+
+    Values JSON cannot represent (timestamps, pandas scalars) are written as
+    their ``str``; numpy scalars keep their numeric value.
+
+    Args:
+        data: Record or list of records to dump
+        path: Destination file
+
+    Returns:
+        The written path
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if orjson is not None:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+        path.write_bytes(orjson.dumps(data, default=str, option=options))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+    return path
@@ -0,0 +1,79 @@
+"""Feather export of ScraperFC match DataFrames for inspection outside the scraper."""
+
+import json
+from pathlib import Path
+
+import pandas as pd
+import pyarrow.feather as feather
+
+
+def _is_nested(value) -> bool:
+    """Check whether a cell holds a Series of DataFrames (e.g. "Home Player Stats")."""
+    return isinstance(value, pd.Series) and all(isinstance(v, pd.DataFrame) for v in value)
+
+
+def _sibling(base: Path, suffix: str) -> Path:
+    """Append ``suffix`` to ``base`` (``with_suffix`` would clobber dotted names)."""
+    return base.parent / f"{base.name}{suffix}"
+
+
+def save_match_feather(result: pd.DataFrame, base: Path):
+    """Write a scraped match DataFrame as Feather.
+
+    Scalar columns go into ``{base}.feather``. Feather cannot hold DataFrames
+    inside object columns, so every nested category is written to its own
+    file under ``{base}/{column}/{category}.feather``. The ``{base}.json``
+    manifest is written last and marks the entry as complete.
+
+    Args:
+        result: Match DataFrame from ``FBref.scrape_match``
+        base: Path prefix for the files, without extension
+    """
+    base = Path(base)
+    base.parent.mkdir(parents=True, exist_ok=True)
+    row = result.iloc[0]
+    manifest = {"columns": list(result.columns), "nested": {}}
+
+    for col in result.columns:
+        if _is_nested(row[col]):
+            col_dir = base / col
+            col_dir.mkdir(parents=True, exist_ok=True)
+            for category, df in row[col].items():
+                feather.write_feather(df.reset_index(drop=True), col_dir / f"{category}.feather",
+                                      compression="uncompressed")
+            manifest["nested"][col] = list(row[col].index)
+
+    scalars = result[[c for c in result.columns if c not in manifest["nested"]]]
+    feather.write_feather(scalars.reset_index(drop=True), _sibling(base, ".feather"),
+                          compression="uncompressed")
+    _sibling(base, ".json").write_text(json.dumps(manifest, indent=2))
+
+
+def load_match_dict(base: Path) -> dict:
+    """Read a cached match as plain dicts, without the nested DataFrame wrapper.
+
+    Returns:
+        Dict with ``meta`` (scalar columns) and one ``{category: DataFrame}``
+        dict per nested column, keyed by column name
+    """
+    base = Path(base)
+    manifest = json.loads(_sibling(base, ".json").read_text())
+    record = {"meta": feather.read_table(_sibling(base, ".feather")).to_pylist()[0]}
+    for col, categories in manifest["nested"].items():
+        record[col] = {
+            category: feather.read_table(base / col / f"{category}.feather").to_pandas()
+            for category in categories
+        }
+    record["columns"] = manifest["columns"]
+    return record
+
+
+def load_match_feather(base: Path) -> pd.DataFrame:
+    """Rebuild a match DataFrame written by ``save_match_feather``."""
+    record = load_match_dict(base)
+    row = dict(record["meta"])
+    for col in record["columns"]:
+        if col not in row:
+            row[col] = pd.Series(record[col])
+    return pd.DataFrame([row], columns=record["columns"])
+
@@ -0,0 +1,30 @@
+"""Process-level memoized match data shared by the debug scripts."""
+
+from functools import lru_cache
+
+import pandas as pd
+
+from scripts._fbref_client import get_scraper
+from scripts._scrape_as_dict import scrape_match_as_dict
+
+
+@lru_cache(maxsize=8)
+def get_match(url: str) -> pd.DataFrame:
+    """Return the full ScraperFC match DataFrame, through the scraper's disk cache."""
+    return get_scraper().scrape_raw(url, full=True)
+
+
+@lru_cache(maxsize=8)
+def get_match_dict(url: str) -> dict:
+    """Return the match as ``{"meta", "home", "away"}`` dicts (see ``scrape_match_as_dict``)."""
+    return scrape_match_as_dict(get_scraper(), url)
+
+
+def get_home_stats(url: str) -> dict:
+    """Return the home team's ``{category: DataFrame}`` player stats."""
+    return get_match_dict(url)["home"]
+
+
+def get_away_stats(url: str) -> dict:
+    """Return the away team's ``{category: DataFrame}`` player stats."""
+    return get_match_dict(url)["away"]
@@ -0,0 +1,32 @@
+"""Match data as plain dicts of DataFrames instead of ScraperFC's nested frame."""
+
+import pandas as pd
+
+from scripts._flatten import TEAM_COLUMNS
+
+
+def scrape_match_as_dict(scraper, url: str) -> dict:
+    """Return a match as ``{"meta": {...}, "home": {...}, "away": {...}}``.
+
+    The full ScraperFC result comes from the scraper's disk cache (scraping
+    on a miss) and is unwrapped once.
+
+    Args:
+        scraper: ``FBrefScraper`` instance
+        url: FBref match URL
+
+    Returns:
+        Dict with scalar match fields under ``meta`` and a
+        ``{category: DataFrame}`` dict per team
+    """
+    result = scraper.scrape_raw(url, full=True)
+    if result is None or result.empty:
+        return {"meta": {}, "home": {}, "away": {}}
+    row = result.iloc[0]
+    return {
+        "meta": {c: row[c] for c in result.columns if not isinstance(row[c], (pd.Series, pd.DataFrame))},
+        **{
+            team: dict(row[col].items()) if col in result.columns else {}
+            for team, col in TEAM_COLUMNS.items()
+        },
+    }
@@ -0,0 +1,18 @@
+"""Column lookups for ScraperFC stat DataFrames, memoized per column layout."""
+
+from functools import lru_cache
+
+import pandas as pd
+
+FOUL_KEYWORDS = ('Fls', 'Fld', 'Foul')
+
+
+@lru_cache(maxsize=256)
+def _name_column(columns: tuple):
+    """Resolve ``name_column_of`` once per column layout (a bounded cache, keyed by value)."""
+    return next((col for col in columns if 'player' in str(col).lower() or 'name' in str(col).lower()), None)
+
+
+def name_column_of(df: pd.DataFrame):
+    """Return the first column whose name mentions a player or name (any case), or None."""
+    return _name_column(tuple(df.columns))
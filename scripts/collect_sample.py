@@ -1,19 +1,38 @@
 """Script to collect a single sample row of player match data."""
 
+import argparse
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-import json
 from datetime import datetime
 from loguru import logger
 import pandas as pd
 
 from src.scrapers.fbref import FBrefScraper
 from src.data.database import init_database, get_db
+from scripts._fbref_client import get_scraper
+from scripts._match_feather import save_match_feather
+from scripts._flatten import match_id_of, write_flat_match
+from scripts._json_out import write_json
 
 
-def collect_sample_match():
+def scrape_player_match(scraper: FBrefScraper, match_url: str, player_name: str):
+    """Scrape a match through the scraper's disk cache and extract one player's data.
+    
+    Returns:
+        Tuple of (raw match DataFrame, player data dict); the dict is empty
+        when ScraperFC returned nothing
+    """
+    match_data = scraper.scrape_raw(match_url, full=True)
+    if match_data is None or match_data.empty:
+        logger.error(f"No data returned for {match_url}")
+        return match_data, {}
+    # Served from the cache entry written just above
+    return match_data, scraper.scrape_match(match_url, player_name)
+
+
+def collect_sample_match(match_url: str, player_name: str, save_to_db: bool = False):
     """Collect data for a single match as a test."""
     
     # Initialize database
@@ -21,12 +40,7 @@ def collect_sample_match():
     init_database()
     
     # Create scraper
-    scraper = FBrefScraper()
-    
-    # Example match URL 
-    # Format: https://fbref.com/en/matches/[match-id]/[match-name]
-    match_url = input("Enter FBref match URL: ").strip()
-    player_name = input("Enter player name to search for: ").strip()
+    scraper = get_scraper()
     
     if not match_url or not player_name:
         logger.error("Match URL and player name are required")
@@ -36,7 +50,7 @@ def collect_sample_match():
     
     try:
         # Scrape the match
-        player_data = scraper.scrape_match(match_url, player_name)
+        match_data, player_data = scrape_player_match(scraper, match_url, player_name)
         
         if not player_data:
             logger.error("No data retrieved")
@@ -55,16 +69,17 @@ def collect_sample_match():
         
         # Save to JSON for inspection
         output_file = f"data/samples/sample_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(output_file, 'w') as f:
-            json.dump(player_data, f, indent=2, default=str)
+        write_json(player_data, output_file)
         
         logger.success(f"Sample data saved to {output_file}")
         
+        # Keep all players' stats in flat Parquet for feature extraction
+        flat_file = Path(f"data/samples/flat/{match_id_of(match_url)}.parquet")
+        if write_flat_match(match_data, flat_file):
+            logger.success(f"Flattened match stats saved to {flat_file}")
+        
         # Optionally save to database
-        save_to_db = input("Save to database? (y/n): ").strip().lower()
-        if save_to_db == 'y':
+        if save_to_db:
             save_sample_to_db(player_data)
             
     except Exception as e:
@@ -72,53 +87,42 @@ def collect_sample_match():
         raise
 
 
+# Rows per INSERT when bulk-loading scraped matches
+FLUSH_EVERY = 500
+
+
 def save_sample_to_db(data: dict):
     """Save sample data to database."""
+    save_samples_to_db([data])
+
+
+def save_samples_to_db(rows: list, scraper: FBrefScraper = None):
+    """Bulk-insert scraped rows, FLUSH_EVERY rows per Arrow batch, in one transaction."""
+    scraper = scraper or get_scraper()
     db = get_db()
     
     try:
-        with db.connect() as conn:
-            # Insert into player_match_stats table
-            conn.execute("""
-                INSERT INTO player_match_stats (
-                    player_name, match_url, date, competition, venue,
-                    starting, position, minutes, fouls, fouled,
-                    team_fouls, team_fouled, team_possession_pct, opponent_possession_pct,
-                    referee_name, attendance, scraped_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.get('player_name'),
-                data.get('match_url'),
-                data.get('date'),
-                data.get('competition'),
-                data.get('venue'),
-                data.get('starting'),
-                data.get('position'),
-                data.get('minutes'),
-                data.get('fouls'),
-                data.get('fouled'),
-                data.get('team_fouls'),
-                data.get('team_fouled'),
-                data.get('team_possession_pct'),
-                data.get('opponent_possession_pct'),
-                data.get('referee_name'),
-                data.get('attendance'),
-                data.get('scraped_at')
-            ))
-            
-            conn.commit()
-            logger.success("Data saved to database")
+        with db as conn:
+            conn.execute("BEGIN")
+            try:
+                saved = sum(scraper.flush_batch(conn, rows[i:i + FLUSH_EVERY])
+                            for i in range(0, len(rows), FLUSH_EVERY))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            # Sidecars only once the rows they belong to are committed
+            scraper.write_blobs(rows)
+            logger.success(f"Saved {saved} rows to database")
             
     except Exception as e:
         logger.error(f"Error saving to database: {e}")
         raise
 
 
-def inspect_match_structure():
+def inspect_match_structure(match_url: str):
     """Inspect the structure of FBref match data."""
-    scraper = FBrefScraper()
-    
-    match_url = input("Enter FBref match URL to inspect structure: ").strip()
+    scraper = get_scraper()
     
     if not match_url:
         logger.error("Match URL is required")
@@ -128,7 +132,7 @@ def inspect_match_structure():
     
     try:
         # Get raw match data
-        match_data = scraper.fbref.scrape_match(match_url)
+        match_data = scraper.scrape_raw(match_url, full=True)
         
         if match_data is None:
             logger.error("No data returned")
@@ -153,12 +157,9 @@ def inspect_match_structure():
         raise
 
 
-def get_raw_dataframe():
+def get_raw_dataframe(match_url: str, player_name: str):
     """Get raw DataFrame for experimentation."""
-    scraper = FBrefScraper()
-    
-    match_url = input("Enter FBref match URL: ").strip()
-    player_name = input("Enter player name: ").strip()
+    scraper = get_scraper()
     
     if not match_url or not player_name:
         logger.error("Match URL and player name are required")
@@ -168,21 +169,17 @@ def get_raw_dataframe():
     
     try:
         # Get raw match data
-        raw_match_data = scraper.fbref.scrape_match(match_url)
+        raw_match_data = scraper.scrape_raw(match_url, full=True)
         
         # Save to file for easy loading in IPython
-        import pickle
-        filename = f"data/samples/raw_data_{player_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pkl"
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filename, 'wb') as f:
-            pickle.dump((raw_match_data, player_name), f)
+        base = f"data/samples/raw_data_{player_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        save_match_feather(raw_match_data, Path(base))
         
-        logger.success(f"Raw data saved to {filename}")
+        logger.success(f"Raw data saved to {base}.feather")
         print(f"\nTo load in IPython, run:")
-        print(f"import pickle")
-        print(f"with open('{filename}', 'rb') as f:")
-        print(f"    raw_data, player_name = pickle.load(f)")
+        print(f"from scripts._match_feather import load_match_feather")
+        print(f"raw_data = load_match_feather('{base}')")
+        print(f"player_name = '{player_name}'")
         
         return raw_match_data, player_name
     except Exception as e:
@@ -190,12 +187,9 @@ def get_raw_dataframe():
         return None
 
 
-def get_player_data_for_experiment():
+def get_player_data_for_experiment(match_url: str, player_name: str):
     """Get final processed player data for experimentation."""
-    scraper = FBrefScraper()
-    
-    match_url = input("Enter FBref match URL: ").strip()
-    player_name = input("Enter player name: ").strip()
+    scraper = get_scraper()
     
     if not match_url or not player_name:
         logger.error("Match URL and player name are required")
@@ -212,18 +206,14 @@ def get_player_data_for_experiment():
             return None
         
         # Save to file for easy loading in IPython
-        import pickle
-        filename = f"data/samples/player_data_{player_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pkl"
-        Path(filename).parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(filename, 'wb') as f:
-            pickle.dump((player_data, player_name), f)
+        filename = f"data/samples/player_data_{player_name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        write_json(player_data, filename)
         
         logger.success(f"Player data saved to {filename}")
         print(f"\nTo load in IPython, run:")
-        print(f"import pickle")
-        print(f"with open('{filename}', 'rb') as f:")
-        print(f"    player_data, player_name = pickle.load(f)")
+        print(f"import json")
+        print(f"with open('{filename}') as f:")
+        print(f"    player_data = json.load(f)")
         print(f"\nPlayer data keys: {list(player_data.keys())}")
         
         return player_data, player_name
@@ -232,37 +222,161 @@ def get_player_data_for_experiment():
         return None
 
 
-if __name__ == "__main__":
+def scrape_matches_batch(urls: list, player_name: str, max_workers: int = 5, scraper: FBrefScraper = None) -> list:
+    """Scrape several matches concurrently for one player.
+    
+    Runs ``FBrefScraper.scrape_matches``, so every scrape is throttled per
+    host, uses its worker thread's own ScraperFC client and goes through the
+    scraper's disk cache (re-runs skip URLs that were already scraped).
+    
+    Args:
+        urls: FBref match URLs
+        player_name: Name of the player to extract data for
+        max_workers: Maximum number of scrapes in flight
+        scraper: Scraper to use; the shared one if omitted
+        
+    Returns:
+        List of player data dicts, in the same order as ``urls``
+    """
+    scraper = scraper or get_scraper()
+    return scraper.scrape_matches(urls, player_name, max_workers=max_workers)
+
+
+def batch_collect_matches(urls_file: str, player_name: str, save_to_db: bool = False):
+    """Collect data for one player across a file of match URLs."""
+    if not urls_file or not player_name:
+        logger.error("URL file and player name are required")
+        return None
+    
+    urls = [line.strip() for line in Path(urls_file).read_text().splitlines() if line.strip()]
+    logger.info(f"Batch scraping {len(urls)} matches for {player_name}")
+    
+    results = scrape_matches_batch(urls, player_name)
+    results = [r for r in results if r]
+    
+    output_file = f"data/samples/batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    write_json(results, output_file)
+    
+    logger.success(f"Collected {len(results)}/{len(urls)} matches, saved to {output_file}")
+    
+    if save_to_db and results:
+        save_samples_to_db(results)
+        
+    return results
+
+
+def list_match_links(league: str, season: str, refresh: bool = False):
+    """Print a league season's match URLs, one per line (usable as --urls-file)."""
+    scraper = get_scraper()
+    links = scraper.get_match_links(league, season, refresh=refresh)
+    for link in links:
+        print(link)
+    return links
+
+
+def _print_raw_result(result):
+    """Print the IPython hint for get_raw_dataframe output."""
+    if result:
+        raw_data, player_name = result
+        print(f"\nRaw DataFrame data for {player_name}:")
+        print("=" * 50)
+        print("Use this in IPython to experiment:")
+        print(f"raw_data = {raw_data}")
+        print(f"player_name = '{player_name}'")
+
+
+def _print_player_result(result):
+    """Print the IPython hint for get_player_data_for_experiment output."""
+    if result:
+        player_data, player_name = result
+        print(f"\nFinal player data for {player_name}:")
+        print("=" * 50)
+        print("Use this in IPython to experiment:")
+        print(f"player_data = {player_data}")
+        print(f"player_name = '{player_name}'")
+
+
+def interactive_menu():
+    """Prompt for a mode and its inputs."""
     print("Player Fouls Data Collection - Sample Test")
     print("==========================================")
     print("1. Collect sample match data for a player")
     print("2. Inspect FBref match data structure")
     print("3. Get raw DataFrame for experimentation")
     print("4. Get final player data for experimentation")
+    print("5. Batch-collect sample matches")
     
-    choice = input("\nEnter choice (1, 2, 3, or 4): ").strip()
+    choice = input("\nEnter choice (1, 2, 3, 4, or 5): ").strip()
     
     if choice == "1":
-        collect_sample_match()
+        # Format: https://fbref.com/en/matches/[match-id]/[match-name]
+        match_url = input("Enter FBref match URL: ").strip()
+        player_name = input("Enter player name to search for: ").strip()
+        save_to_db = input("Save to database? (y/n): ").strip().lower() == 'y'
+        collect_sample_match(match_url, player_name, save_to_db)
     elif choice == "2":
-        inspect_match_structure()
+        inspect_match_structure(input("Enter FBref match URL to inspect structure: ").strip())
     elif choice == "3":
-        result = get_raw_dataframe()
-        if result:
-            raw_data, player_name = result
-            print(f"\nRaw DataFrame data for {player_name}:")
-            print("=" * 50)
-            print("Use this in IPython to experiment:")
-            print(f"raw_data = {raw_data}")
-            print(f"player_name = '{player_name}'")
+        match_url = input("Enter FBref match URL: ").strip()
+        player_name = input("Enter player name: ").strip()
+        _print_raw_result(get_raw_dataframe(match_url, player_name))
     elif choice == "4":
-        result = get_player_data_for_experiment()
-        if result:
-            player_data, player_name = result
-            print(f"\nFinal player data for {player_name}:")
-            print("=" * 50)
-            print("Use this in IPython to experiment:")
-            print(f"player_data = {player_data}")
-            print(f"player_name = '{player_name}'")
+        match_url = input("Enter FBref match URL: ").strip()
+        player_name = input("Enter player name: ").strip()
+        _print_player_result(get_player_data_for_experiment(match_url, player_name))
+    elif choice == "5":
+        urls_file = input("Enter path to file with FBref match URLs (one per line): ").strip()
+        player_name = input("Enter player name to search for: ").strip()
+        save_to_db = input("Save to database? (y/n): ").strip().lower() == 'y'
+        batch_collect_matches(urls_file, player_name, save_to_db)
     else:
-        print("Invalid choice")
\ No newline at end of file
+        print("Invalid choice")
+
+
+def main():
+    """Parse command-line arguments and run the requested mode."""
+    parser = argparse.ArgumentParser(description="Collect sample FBref player match data")
+    parser.add_argument("--mode", choices=["sample", "inspect", "raw", "processed", "batch", "links"],
+                        help="What to collect; omit to use the interactive menu")
+    parser.add_argument("--url", help="FBref match URL")
+    parser.add_argument("--player", help="Player name as it appears on FBref")
+    parser.add_argument("--urls-file", help="File with one FBref match URL per line (batch mode)")
+    parser.add_argument("--league", help="League name, e.g. 'Premier League' (links mode)")
+    parser.add_argument("--season", help="Season, e.g. 2023-2024 (links mode)")
+    parser.add_argument("--refresh-links", action="store_true",
+                        help="Ignore cached match links and fetch them again (links mode)")
+    parser.add_argument("--no-save", action="store_true", help="Do not save results to the database")
+    parser.add_argument("--interactive", action="store_true", help="Use the interactive menu")
+    args = parser.parse_args()
+    
+    if args.interactive or args.mode is None:
+        interactive_menu()
+        return
+    
+    if args.mode == "batch":
+        if not args.urls_file or not args.player:
+            parser.error("--urls-file and --player are required for batch mode")
+    elif args.mode == "links":
+        if not args.league or not args.season:
+            parser.error("--league and --season are required for links mode")
+    elif not args.url:
+        parser.error(f"--url is required for {args.mode} mode")
+    elif args.mode != "inspect" and not args.player:
+        parser.error(f"--player is required for {args.mode} mode")
+    
+    if args.mode == "sample":
+        collect_sample_match(args.url, args.player, save_to_db=not args.no_save)
+    elif args.mode == "inspect":
+        inspect_match_structure(args.url)
+    elif args.mode == "raw":
+        _print_raw_result(get_raw_dataframe(args.url, args.player))
+    elif args.mode == "processed":
+        _print_player_result(get_player_data_for_experiment(args.url, args.player))
+    elif args.mode == "batch":
+        batch_collect_matches(args.urls_file, args.player, save_to_db=not args.no_save)
+    elif args.mode == "links":
+        list_match_links(args.league, args.season, refresh=args.refresh_links)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,10 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from ScraperFC import FBref
 import pandas as pd
 
+from scripts._match_fixture import get_match
+
 
 def debug_scraperfc():
     """Debug what ScraperFC actually returns."""
@@ -15,11 +16,9 @@ def debug_scraperfc():
     
     match_url = "https://fbref.com/en/matches/b9e00aac/Chelsea-Nottingham-Forest-October-6-2024-Premier-League"
     
-    fbref = FBref()
-    
     try:
         print("Calling fbref.scrape_match()...")
-        result = fbref.scrape_match(match_url)
+        result = get_match(match_url)
         
         print(f"\nResult type: {type(result)}")
         
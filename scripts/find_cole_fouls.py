@@ -1,12 +1,19 @@
 #!/usr/bin/env python3
 """Find Cole Palmer's foul-related stats."""
 
+import os
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from ScraperFC import FBref
-import pandas as pd
+import pyarrow.compute as pc
+
+from scripts._match_fixture import get_home_stats
+from scripts._arrow_stats import to_long_arrow, find_player
+from scripts._stats_utils import FOUL_KEYWORDS
+
+# Set DEBUG=1 to print full rosters and every column of matched rows
+DEBUG = os.getenv("DEBUG") == "1"
 
 
 def find_cole_fouls():
@@ -15,65 +22,35 @@ def find_cole_fouls():
     
     match_url = "https://fbref.com/en/matches/b9e00aac/Chelsea-Nottingham-Forest-October-6-2024-Premier-League"
     
-    fbref = FBref()
-    result = fbref.scrape_match(match_url)
-    
     # Get home team stats (Chelsea)
-    home_stats = result.iloc[0]["Home Player Stats"]
+    home_stats = get_home_stats(match_url)
     
     print("Available stat categories:")
-    for category in home_stats.index:
+    for category in home_stats:
         print(f"  - {category}")
     
-    # Look through each category for foul-related columns
-    for category in home_stats.index:
-        df = home_stats[category]
-        if isinstance(df, pd.DataFrame):
-            # Look for foul-related columns
-            foul_cols = [col for col in df.columns if 'Fls' in str(col) or 'Fld' in str(col) or 'Foul' in str(col)]
-            if foul_cols:
-                print(f"\n🔍 Found foul columns in '{category}' category: {foul_cols}")
-                
-                # Find Cole Palmer in this category
-                player_col = None
-                for col in df.columns:
-                    if 'Player' in str(col):
-                        player_col = col
-                        break
-                
-                if player_col:
-                    cole_rows = df[df[player_col].str.contains("Cole Palmer", na=False)]
-                    if not cole_rows.empty:
-                        print(f"Cole Palmer's {category} stats:")
-                        cole_data = cole_rows.iloc[0]
-                        for col in foul_cols:
-                            print(f"  {col}: {cole_data[col]}")
-                        
-                        # Show all stats for context
-                        print(f"\nAll Cole Palmer's {category} stats:")
-                        for col in df.columns:
-                            print(f"  {col}: {cole_data[col]}")
+    # Convert all categories once, then locate Cole Palmer with a single filter
+    cole_rows = find_player(to_long_arrow(home_stats, "home"), "Cole Palmer")
+    foul_cols = [c for c in cole_rows.column_names if any(k in c for k in FOUL_KEYWORDS)]
     
-    # Check if Misc category has foul data
-    if "Misc" in home_stats.index:
-        print(f"\n📊 Detailed look at 'Misc' category:")
-        misc_df = home_stats["Misc"]
-        print(f"Misc columns: {list(misc_df.columns)}")
-        
-        # Find Cole Palmer in Misc
-        player_col = None
-        for col in misc_df.columns:
-            if 'Player' in str(col):
-                player_col = col
-                break
-                
-        if player_col:
-            cole_rows = misc_df[misc_df[player_col].str.contains("Cole Palmer", na=False)]
-            if not cole_rows.empty:
-                print("Cole Palmer's Misc stats (likely contains fouls):")
-                cole_data = cole_rows.iloc[0]
-                for col in misc_df.columns:
-                    print(f"  {col}: {cole_data[col]}")
+    for category in home_stats:
+        rows = cole_rows.filter(pc.equal(cole_rows["category"], category)).to_pylist()
+        if not rows:
+            continue
+        cole_data = rows[0]
+        cat_fouls = [c for c in foul_cols if cole_data[c] is not None]
+        if cat_fouls:
+            print(f"\n🔍 Found foul columns in '{category}' category: {cat_fouls}")
+            print(f"Cole Palmer's {category} stats:")
+            for col in cat_fouls:
+                print(f"  {col}: {cole_data[col]}")
+            
+            # Show all stats for context
+            if DEBUG:
+                print(f"\nAll Cole Palmer's {category} stats:")
+                for col, value in cole_data.items():
+                    if value is not None:
+                        print(f"  {col}: {value}")
 
 
 if __name__ == "__main__":
@@ -1,12 +1,42 @@
 #!/usr/bin/env python3
 """Find Cole Palmer in the match data."""
 
+import os
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
-from ScraperFC import FBref
-import pandas as pd
+from scripts._match_fixture import get_match_dict, get_home_stats, get_away_stats
+from scripts._arrow_stats import to_long_arrow, find_player
+
+# Set DEBUG=1 to print full rosters and every column of matched rows
+DEBUG = os.getenv("DEBUG") == "1"
+
+
+# Summary "Performance" columns plus minutes played
+KEY_STATS = ("Min", "Gls", "Ast", "PK", "PKatt", "Sh", "SoT", "CrdY", "CrdR",
+             "Touches", "Tkl", "Int", "Blocks")
+
+
+def _scan(team_stats: dict, team: str, name: str = "Cole Palmer"):
+    """Look for ``name`` in a team's Summary stats only.
+
+    Returns:
+        ``(team, row)`` for the first matching player, or None (also when the
+        team has no Summary stats)
+    """
+    summary = team_stats.get("Summary")
+    if summary is None:
+        return None
+    rows = find_player(to_long_arrow({"Summary": summary}, team), name)
+    return (team, rows.slice(0, 1).to_pylist()[0]) if rows.num_rows else None
+
+
+def _print_stats(cole_data: dict):
+    """Print the key stats of a matched row (every non-null stat when DEBUG)."""
+    for col_name, value in cole_data.items():
+        if value is not None and (DEBUG or col_name in KEY_STATS):
+            print(f"  {col_name}: {value}")
 
 
 def find_cole_palmer():
@@ -15,77 +45,30 @@ def find_cole_palmer():
     
     match_url = "https://fbref.com/en/matches/b9e00aac/Chelsea-Nottingham-Forest-October-6-2024-Premier-League"
     
-    fbref = FBref()
-    result = fbref.scrape_match(match_url)
+    meta = get_match_dict(match_url)["meta"]
     
     # First, let's see which team is which
-    print(f"Home Team: {result.iloc[0]['Home Team']}")
-    print(f"Away Team: {result.iloc[0]['Away Team']}")
-    
-    # Check home team stats first
-    print("\n=== HOME TEAM STATS ===")
-    home_stats = result.iloc[0]["Home Player Stats"]
-    home_summary_df = home_stats["Summary"]
-    
-    # Find the player column and look for Cole Palmer
-    for col in home_summary_df.columns:
-        if 'Player' in str(col):
-            players = home_summary_df[col]
-            print("Home team players:")
-            for i, player in enumerate(players):
-                marker = "🎯" if "Cole Palmer" in str(player) else "  "
-                print(f"{marker} {i}: {player}")
-                
-            # Try to find Cole Palmer specifically
-            cole_palmer_rows = home_summary_df[home_summary_df[col].str.contains("Cole Palmer", na=False)]
-            if not cole_palmer_rows.empty:
-                print(f"\n✓ Found Cole Palmer in HOME team!")
-                print("Cole Palmer's summary data:")
-                cole_data = cole_palmer_rows.iloc[0]
-                
-                # Show his key stats
-                print("\nCole Palmer's key stats from Summary:")
-                for col_name in home_summary_df.columns:
-                    value = cole_data[col_name]
-                    if 'Performance' in str(col_name) or 'Min' in str(col_name):
-                        print(f"  {col_name}: {value}")
-                return True
-            break
+    print(f"Home Team: {meta['Home Team']}")
+    print(f"Away Team: {meta['Away Team']}")
     
-    # Check away team stats
-    print("\n=== AWAY TEAM STATS ===")
-    away_stats = result.iloc[0]["Away Player Stats"]
-    summary_df = away_stats["Summary"]
+    # Home first; the away team is only converted and scanned on a miss
+    hit = _scan(get_home_stats(match_url), "home")
+    if hit is None:
+        summary_df = get_away_stats(match_url).get("Summary")
+        if DEBUG and summary_df is not None:
+            print(f"Summary DataFrame shape: {summary_df.shape}")
+            print(f"Summary DataFrame columns: {summary_df.columns}")
+        hit = _scan(get_away_stats(match_url), "away")
     
-    print(f"Summary DataFrame shape: {summary_df.shape}")
-    print(f"Summary DataFrame columns: {summary_df.columns}")
+    if hit is None:
+        print("\n✗ Cole Palmer not found")
+        return False
     
-    # Find the player column
-    for col in summary_df.columns:
-        if 'Player' in str(col):
-            print(f"\nFound player column: {col}")
-            players = summary_df[col]
-            print("Players in this match:")
-            for i, player in enumerate(players):
-                marker = "🎯" if "Cole Palmer" in str(player) else "  "
-                print(f"{marker} {i}: {player}")
-            
-            # Try to find Cole Palmer
-            cole_palmer_rows = summary_df[summary_df[col].str.contains("Cole Palmer", na=False)]
-            if not cole_palmer_rows.empty:
-                print(f"\n✓ Found Cole Palmer!")
-                print("Cole Palmer's data:")
-                cole_data = cole_palmer_rows.iloc[0]
-                print(cole_data)
-                
-                # Show his stats
-                print("\nCole Palmer's key stats:")
-                for col_name in summary_df.columns:
-                    value = cole_data[col_name]
-                    print(f"  {col_name}: {value}")
-            else:
-                print("\n✗ Cole Palmer not found")
-            break
+    team, cole_data = hit
+    print(f"\n✓ Found Cole Palmer in {team.upper()} team!")
+    print("\nCole Palmer's key stats from Summary:")
+    _print_stats(cole_data)
+    return True
 
 
 if __name__ == "__main__":
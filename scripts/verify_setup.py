@@ -14,16 +14,16 @@ def test_database_connection():
         from src.data.database import get_db
         
         db = get_db()
-        with db.connect() as conn:
-            # Test basic query
-            result = conn.execute("SELECT 1 as test").fetchone()
-            if result[0] == 1:
-                logger.success("✓ Database connection working")
-                return True
-            else:
-                logger.error("✗ Database query returned unexpected result")
-                return False
-                
+        conn = db.connect()
+        # Test basic query
+        result = conn.execute("SELECT 1 as test").fetchone()
+        if result[0] == 1:
+            logger.success("✓ Database connection working")
+            return True
+        else:
+            logger.error("✗ Database query returned unexpected result")
+            return False
+            
     except Exception as e:
         logger.error(f"✗ Database connection failed: {e}")
         return False
@@ -61,26 +61,16 @@ def test_database_schema():
         from src.data.database import get_db
         
         db = get_db()
-        with db.connect() as conn:
-            # Check if our main table exists
-            tables = conn.execute("""
-                SELECT table_name 
-                FROM information_schema.tables 
-                WHERE table_schema = 'main'
-            """).fetchall()
-            
-            table_names = [table[0] for table in tables]
-            expected_tables = ['player_match_stats', 'players', 'teams', 'referees', 'matches']
-            
-            missing_tables = [table for table in expected_tables if table not in table_names]
+        expected_tables = ['player_match_stats', 'players', 'teams', 'referees', 'matches']
+        missing_tables = sorted(set(expected_tables) - db.tables())
+        
+        if not missing_tables:
+            logger.success(f"✓ All database tables exist: {', '.join(expected_tables)}")
+            return True
+        else:
+            logger.error(f"✗ Missing database tables: {', '.join(missing_tables)}")
+            return False
             
-            if not missing_tables:
-                logger.success(f"✓ All database tables exist: {', '.join(expected_tables)}")
-                return True
-            else:
-                logger.error(f"✗ Missing database tables: {', '.join(missing_tables)}")
-                return False
-                
     except Exception as e:
         logger.error(f"✗ Database schema check failed: {e}")
         return False
@@ -0,0 +1,17 @@
+"""Player fouls model package.
+
+``FBrefScraper`` and ``Database`` are resolved on first access, so importing
+``src`` does not load ScraperFC, pandas or duckdb.
+"""
+
+_LAZY = {
+    "FBrefScraper": "src.scrapers.fbref",
+    "Database": "src.data.database",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
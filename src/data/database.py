@@ -1,19 +1,38 @@
 """DuckDB database connection and initialization."""
 
+import atexit
 import os
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-import duckdb
+from typing import Any, Iterator, Optional, Set, TYPE_CHECKING
 from loguru import logger
 from dotenv import load_dotenv
 
 from .schema import ALL_SCHEMAS
 
+if TYPE_CHECKING:
+    import duckdb
+
 load_dotenv()
 
+# All CREATE statements as one script, so they are parsed and committed together
+_INIT_SCRIPT = "\n".join(ALL_SCHEMAS)
+
 
 class Database:
-    """DuckDB database connection manager."""
+    """DuckDB database connection manager.
+    
+    Worker threads should each call ``get_worker_connection`` once and reuse
+    the result, or borrow a pooled cursor with ``acquire()``. Those cursors
+    share the database instance, catalog and buffer pool of the main
+    connection. Temporary tables and registered views are per cursor.
+    """
+    
+    # Directories already created by any instance in this process
+    _dirs_ensured: Set[Path] = set()
     
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database connection.
@@ -24,35 +43,102 @@ class Database:
         self.db_path = db_path or os.getenv("DUCKDB_PATH", "data/duckdb/playerfouls.db")
         self._ensure_db_directory()
         self.conn = None
+        self.pool_size = int(os.getenv("DUCKDB_POOL_SIZE", "4"))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._table_set = None
         
     def _ensure_db_directory(self):
         """Ensure the database directory exists."""
         db_dir = Path(self.db_path).parent
+        if db_dir in self._dirs_ensured:
+            return
         db_dir.mkdir(parents=True, exist_ok=True)
+        self._dirs_ensured.add(db_dir)
         logger.info(f"Database directory ensured: {db_dir}")
         
-    def connect(self) -> duckdb.DuckDBPyConnection:
+    def connect(self) -> "duckdb.DuckDBPyConnection":
         """Create or return database connection."""
         if self.conn is None:
+            import duckdb
+            
             self.conn = duckdb.connect(self.db_path)
             logger.info(f"Connected to DuckDB at {self.db_path}")
         return self.conn
     
+    def get_worker_connection(self) -> "duckdb.DuckDBPyConnection":
+        """Return a new cursor on the shared connection for one worker thread.
+        
+        Call once per worker, not per query: creating a cursor costs far more
+        than running a query on an existing one.
+        """
+        return self.connect().cursor()
+    
+    @contextmanager
+    def acquire(self) -> Iterator["duckdb.DuckDBPyConnection"]:
+        """Borrow a cursor from the pool, blocking until one is free.
+        
+        The pool is a LIFO queue of ``pool_size`` cursors on the shared
+        connection, filled on first use. LIFO hands out the most recently
+        used (warm) cursor first.
+        """
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = queue.LifoQueue(maxsize=self.pool_size)
+                for _ in range(self.pool_size):
+                    self._pool.put(self.get_worker_connection())
+            pool = self._pool
+        cursor = pool.get()
+        try:
+            yield cursor
+        finally:
+            pool.put(cursor)
+    
+    def execute(self, sql: str, params: Optional[Any] = None) -> list:
+        """Run one statement on a pooled cursor and fetch its rows.
+        
+        Args:
+            sql: SQL text, with ``?`` placeholders for ``params``
+            params: Parameters for the statement, if any
+            
+        Returns:
+            List of result rows (empty for statements without results)
+        """
+        with self.acquire() as cursor:
+            cursor.execute(sql, params)
+            return cursor.fetchall() if cursor.description else []
+    
+    def tables(self) -> Set[str]:
+        """Return the names of the tables in the main schema, queried once per session."""
+        if self._table_set is None:
+            rows = self.connect().execute("""
+                SELECT table_name
+                FROM information_schema.tables
+                WHERE table_schema = 'main'
+            """).fetchall()
+            self._table_set = {row[0] for row in rows}
+        return self._table_set
+    
     def initialize_schema(self):
         """Create all tables if they don't exist."""
         conn = self.connect()
-        for schema in ALL_SCHEMAS:
-            try:
-                conn.execute(schema)
-                logger.debug(f"Schema created/verified")
-            except Exception as e:
-                logger.error(f"Error creating schema: {e}")
-                raise
-        conn.commit()
+        conn.begin()
+        try:
+            conn.execute(_INIT_SCRIPT)
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            logger.error(f"Error creating schema: {e}")
+            raise
+        self._table_set = None
         logger.info("All database schemas initialized")
     
     def close(self):
         """Close database connection."""
+        if self._pool is not None:
+            while not self._pool.empty():
+                self._pool.get_nowait().close()
+            self._pool = None
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -63,18 +149,27 @@ class Database:
         return self.connect()
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+        """Context manager exit.
+        
+        The connection is shared for the whole process (``get_db`` closes it
+        at exit), so leaving a ``with`` block does not close it.
+        """
 
 
-def get_db() -> Database:
-    """Get database instance."""
-    return Database()
+@lru_cache(maxsize=1)
+def get_db(db_path: Optional[str] = None) -> Database:
+    """Get the shared database instance, closed once at interpreter exit.
+    
+    Args:
+        db_path: Path to DuckDB database file. If None, uses env variable.
+    """
+    db = Database(db_path)
+    atexit.register(db.close)
+    return db
 
 
 def init_database():
     """Initialize database with all schemas."""
     db = get_db()
     db.initialize_schema()
-    db.close()
     logger.info("Database initialization complete")
\ No newline at end of file
@@ -1,5 +1,7 @@
 """DuckDB schema definitions for player fouls data."""
 
+from functools import lru_cache
+
 PLAYER_MATCH_STATS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS player_match_stats (
     -- Identifiers
@@ -15,39 +17,36 @@ CREATE TABLE IF NOT EXISTS player_match_stats (
     opponent VARCHAR,
     starting BOOLEAN,  -- NEW: Whether player started
     position VARCHAR,
-    minutes INTEGER,
-    fouls INTEGER,
-    fouled INTEGER,
-    tackles INTEGER,
-    tackles_def_3rd INTEGER,
-    tackles_mid_3rd INTEGER,
-    tackles_att_3rd INTEGER,
-    challenges INTEGER,
-    take_ons INTEGER,
-    team_fouls INTEGER,  -- NEW: Total fouls by player's team
-    team_fouled INTEGER,  -- NEW: Total times player's team was fouled
-    team_possession_pct FLOAT,  -- NEW: Team's possession percentage
-    opponent_possession_pct FLOAT,  -- NEW: Opponent's possession percentage
+    minutes USMALLINT,
+    fouls UTINYINT,
+    fouled UTINYINT,
+    tackles UTINYINT,
+    tackles_def_3rd UTINYINT,
+    tackles_mid_3rd UTINYINT,
+    tackles_att_3rd UTINYINT,
+    challenges UTINYINT,
+    take_ons UTINYINT,
+    team_fouls UTINYINT,  -- NEW: Total fouls by player's team
+    team_fouled UTINYINT,  -- NEW: Total times player's team was fouled
+    team_possession_pct DECIMAL(5,2),  -- NEW: Team's possession percentage
+    opponent_possession_pct DECIMAL(5,2),  -- NEW: Opponent's possession percentage
     
-    -- Sofascore columns (4)
+    -- Sofascore columns (4; heatmap, nearest_opponents and
+    -- nearest_opponents_fouled live in the Parquet blob sidecar)
     odds_winning FLOAT,
-    heatmap JSON,  -- Store as JSON
-    nearest_opponents JSON,  -- List of player IDs/names
-    nearest_opponents_fouled JSON,  -- List of foul counts
     
-    -- Whoscored columns (7)
-    foul_position JSON,  -- Coordinates
-    team_left_attack_pct FLOAT,
-    team_mid_attack_pct FLOAT,
-    team_right_attack_pct FLOAT,
-    opponent_left_attack_pct FLOAT,
-    opponent_mid_attack_pct FLOAT,
-    opponent_right_attack_pct FLOAT,
+    -- Whoscored columns (7; foul_position lives in the Parquet blob sidecar)
+    team_left_attack_pct DECIMAL(5,2),
+    team_mid_attack_pct DECIMAL(5,2),
+    team_right_attack_pct DECIMAL(5,2),
+    opponent_left_attack_pct DECIMAL(5,2),
+    opponent_mid_attack_pct DECIMAL(5,2),
+    opponent_right_attack_pct DECIMAL(5,2),
     
     -- Metadata
     referee_id VARCHAR,
     referee_name VARCHAR,  -- NEW: Match referee name
-    attendance INTEGER,  -- NEW: Match attendance
+    attendance UINTEGER,  -- NEW: Match attendance
     comments TEXT,
     scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     
@@ -56,6 +55,70 @@ CREATE TABLE IF NOT EXISTS player_match_stats (
 );
 """
 
+# Secondary indexes for the common lookups (by match, referee and date)
+PLAYER_MATCH_STATS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_pms_match ON player_match_stats(match_id);
+CREATE INDEX IF NOT EXISTS idx_pms_referee ON player_match_stats(referee_id);
+CREATE INDEX IF NOT EXISTS idx_pms_date ON player_match_stats(date);
+"""
+
+
+@lru_cache(maxsize=1)
+def player_match_stats_arrow_schema():
+    """Arrow mirror of player_match_stats, used for bulk inserts.
+    
+    Built on first use so importing the schema module does not load pyarrow.
+    """
+    import pyarrow as pa
+    
+    return pa.schema([
+        ("player_id", pa.string()),
+        ("player_name", pa.string()),
+        ("match_id", pa.string()),
+        ("date", pa.date32()),
+        ("competition", pa.string()),
+        ("venue", pa.string()),
+        ("result", pa.string()),
+        ("opponent", pa.string()),
+        ("starting", pa.bool_()),
+        ("position", pa.string()),
+        ("minutes", pa.uint16()),
+        ("fouls", pa.uint8()),
+        ("fouled", pa.uint8()),
+        ("tackles", pa.uint8()),
+        ("tackles_def_3rd", pa.uint8()),
+        ("tackles_mid_3rd", pa.uint8()),
+        ("tackles_att_3rd", pa.uint8()),
+        ("challenges", pa.uint8()),
+        ("take_ons", pa.uint8()),
+        ("team_fouls", pa.uint8()),
+        ("team_fouled", pa.uint8()),
+        ("team_possession_pct", pa.decimal128(5, 2)),
+        ("opponent_possession_pct", pa.decimal128(5, 2)),
+        ("odds_winning", pa.float32()),
+        ("team_left_attack_pct", pa.decimal128(5, 2)),
+        ("team_mid_attack_pct", pa.decimal128(5, 2)),
+        ("team_right_attack_pct", pa.decimal128(5, 2)),
+        ("opponent_left_attack_pct", pa.decimal128(5, 2)),
+        ("opponent_mid_attack_pct", pa.decimal128(5, 2)),
+        ("opponent_right_attack_pct", pa.decimal128(5, 2)),
+        ("referee_id", pa.string()),
+        ("referee_name", pa.string()),
+        ("attendance", pa.uint32()),
+        ("comments", pa.string()),
+        ("scraped_at", pa.timestamp("ns")),
+    ])
+
+
+# JSON payloads kept out of player_match_stats; they are written as one Parquet
+# file per match under PLAYER_MATCH_BLOBS_DIR, one row per (player_id, match_id)
+# (see FBrefScraper.write_blobs). Query with
+#   SELECT ... FROM player_match_stats
+#   JOIN read_parquet('data/duckdb/blobs/*.parquet') USING (player_id, match_id)
+PLAYER_MATCH_BLOB_COLUMNS = ("heatmap", "nearest_opponents", "nearest_opponents_fouled", "foul_position")
+
+PLAYER_MATCH_BLOBS_DIR = "data/duckdb/blobs"
+
 PLAYERS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS players (
     player_id VARCHAR PRIMARY KEY,
@@ -116,5 +179,6 @@ ALL_SCHEMAS = [
     TEAMS_SCHEMA,
     REFEREES_SCHEMA,
     MATCHES_SCHEMA,
-    PLAYER_MATCH_STATS_SCHEMA
+    PLAYER_MATCH_STATS_SCHEMA,
+    PLAYER_MATCH_STATS_INDEXES,
 ]
\ No newline at end of file
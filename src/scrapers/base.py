@@ -1,9 +1,15 @@
 """Base scraper class for all data sources."""
 
 import time
+import random
+import threading
+import unicodedata
 from abc import ABC, abstractmethod
+from collections import deque
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
+from urllib.parse import urlsplit
 import os
 
 from loguru import logger
@@ -12,6 +18,67 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+class RateLimiter:
+    """Sliding-window limiter: at most ``max_calls`` acquisitions per ``period`` seconds,
+    spaced at least ``min_interval`` seconds apart.
+    
+    Thread-safe; callers sleep only for the remaining deficit, so a request
+    made long enough after the previous one goes out immediately.
+    """
+    
+    def __init__(self, max_calls: int, period: float, min_interval: float = 0.0):
+        self.max_calls = max_calls
+        self.period = period
+        self.min_interval = min_interval
+        self._calls = deque()
+        self._last = float("-inf")
+        self._lock = threading.Lock()
+        
+    def acquire(self):
+        """Block until a call is allowed, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._calls and now - self._calls[0] >= self.period:
+                    self._calls.popleft()
+                if len(self._calls) < self.max_calls:
+                    delay = self._last + self.min_interval - now
+                    if delay <= 0:
+                        self._calls.append(now)
+                        self._last = now
+                        return
+                else:
+                    delay = self.period - (now - self._calls[0])
+            time.sleep(delay)
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def limiter_for(host: str, max_calls: int, period: float, min_interval: float = 0.0) -> RateLimiter:
+    """Return the process-wide limiter for a host, creating it on first use."""
+    with _limiters_lock:
+        if host not in _limiters:
+            _limiters[host] = RateLimiter(max_calls, period, min_interval)
+        return _limiters[host]
+
+
+# Latin letters NFKD does not decompose into an ASCII base
+_LATIN_FOLDS = str.maketrans({"Ø": "O", "ø": "o", "Ł": "L", "ł": "l", "Đ": "D", "đ": "d",
+                              "Æ": "AE", "æ": "ae", "ß": "ss", "ı": "i"})
+
+
+@lru_cache(maxsize=4096)
+def normalize_name(name: str) -> str:
+    """Normalize a player name for index lookups (accents stripped, casefolded)."""
+    name = str(name)
+    # Names without a Latin transliteration (e.g. CJK) would strip to nothing
+    decomposed = unicodedata.normalize("NFKD", name.translate(_LATIN_FOLDS))
+    ascii_name = decomposed.encode("ascii", "ignore").decode().strip()
+    return (ascii_name or name).casefold().strip()
+
+
 class BaseScraper(ABC):
     """Abstract base class for all scrapers."""
     
@@ -19,11 +86,25 @@ class BaseScraper(ABC):
         self.scrape_delay = float(os.getenv("SCRAPE_DELAY", "2"))
         self.max_retries = int(os.getenv("MAX_RETRIES", "3"))
         self.timeout = int(os.getenv("TIMEOUT", "30"))
+        # Per-host budget; the default averages one request per SCRAPE_DELAY
+        self.rate_limit_calls = int(os.getenv("RATE_LIMIT_CALLS", "10"))
+        self.rate_limit_period = float(os.getenv("RATE_LIMIT_PERIOD", str(self.rate_limit_calls * self.scrape_delay)))
+        # Minimum spacing between two requests to the same host
+        self.min_request_interval = float(os.getenv("MIN_REQUEST_INTERVAL", "1.5"))
         
     def _wait(self):
         """Wait between requests to be respectful."""
         time.sleep(self.scrape_delay)
         
+    def _throttle(self, url: str):
+        """Block until the per-host rate limit allows a request to ``url``."""
+        host = urlsplit(url).netloc or url
+        limiter_for(host, self.rate_limit_calls, self.rate_limit_period, self.min_request_interval).acquire()
+        
+    def _backoff(self, attempt: int):
+        """Sleep before retry ``attempt + 1``: exponential in the attempt, capped at 30s, with jitter."""
+        time.sleep(min(30, self.scrape_delay * (2 ** attempt)) + random.random() * 0.5)
+        
     @abstractmethod
     def scrape_match(self, match_id: str, **kwargs) -> Dict[str, Any]:
         """Scrape data for a single match.
@@ -72,8 +153,8 @@ class BaseScraper(ABC):
                     
             except Exception as e:
                 logger.error(f"Error scraping {match_id}: {e}")
-                if attempt < self.max_retries - 1:
-                    self._wait()
+                if attempt + 1 < self.max_retries:
+                    self._backoff(attempt)
                     
         logger.error(f"Failed to scrape {match_id} after {self.max_retries} attempts")
         return None
\ No newline at end of file
@@ -1,44 +1,321 @@
 """Fixed FBref scraper that handles the real ScraperFC data structure."""
 
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Set, Tuple, TYPE_CHECKING
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import gzip
+import hashlib
+from contextlib import contextmanager
+from functools import lru_cache, reduce
+import io
+import json
+import time
+from decimal import Decimal
+import os
+import pickle
+import shutil
+import threading
+from pathlib import Path
 import pandas as pd
 from loguru import logger
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+import lxml.html
+from lxml import etree
 import re
 
-try:
+from .base import BaseScraper, normalize_name
+from ..data.schema import (
+    player_match_stats_arrow_schema, PLAYER_MATCH_BLOB_COLUMNS, PLAYER_MATCH_BLOBS_DIR,
+)
+
+if TYPE_CHECKING:
     from ScraperFC import FBref as ScraperFCFBref
-except ImportError:
-    logger.error("ScraperFC not installed. Run: pip install ScraperFC")
-    raise
 
-from .base import BaseScraper
+
+# Column -> field mappings per stat category (commented entries are not collected yet)
+_CATEGORY_MAPPINGS: Dict[str, Dict[tuple, str]] = {
+    "Summary": {
+        ("Unnamed: 5_level_0", "Min"): "minutes",
+        ("Unnamed: 3_level_0", "Pos"): "position",
+        #("Performance", "Gls"): "goals",
+        #("Performance", "Ast"): "assists",
+        #("Performance", "Sh"): "shots",
+        #("Performance", "SoT"): "shots_on_target",
+        ("Performance", "CrdY"): "yellow_cards",
+        ("Performance", "CrdR"): "red_cards",
+        #("Performance", "Touches"): "touches",
+        ("Performance", "Tkl"): "tackles",
+        #("Performance", "Int"): "interceptions",
+        #("Performance", "Blocks"): "blocks",
+    },
+    "Misc": {
+        ("Performance", "Fls"): "fouls",
+        ("Performance", "Fld"): "fouled",
+        #("Performance", "Off"): "offsides",
+        #("Performance", "Crs"): "crosses",
+        #("Performance", "TklW"): "tackles_won",
+        #("Performance", "PKwon"): "penalties_won",
+        #("Performance", "PKcon"): "penalties_conceded",
+        #("Performance", "Recov"): "recoveries",
+        #("Aerial Duels", "Won"): "aerial_duels_won",
+        #("Aerial Duels", "Lost"): "aerial_duels_lost",
+    },
+    "Defense": {
+        ("Tackles", "Tkl"): "tackles_total",
+        #("Tackles", "TklW"): "tackles_won_def",
+        ("Tackles", "Def 3rd"): "tackles_def_3rd",
+        ("Tackles", "Mid 3rd"): "tackles_mid_3rd",
+        ("Tackles", "Att 3rd"): "tackles_att_3rd",
+        ("Challenges", "Att"): "challenges_attempted",
+        #("Challenges", "Tkl%"): "tackle_success_pct",
+        #("Challenges", "Lost"): "challenges_lost",
+    },
+    "Possession": {
+        #("Touches", "Touches"): "touches_total",
+        #("Touches", "Def Pen"): "touches_def_pen",
+        #("Touches", "Def 3rd"): "touches_def_3rd",
+        #("Touches", "Mid 3rd"): "touches_mid_3rd",
+        #("Touches", "Att 3rd"): "touches_att_3rd",
+        #("Touches", "Att Pen"): "touches_att_pen",
+        ("Take-Ons", "Att"): "take_ons_attempted",
+        ("Take-Ons", "Succ"): "take_ons_succeeded",
+        #("Carries", "Carries"): "carries",
+        #("Carries", "PrgC"): "progressive_carries",
+    },
+}
+
+# Other categories are not mapped yet
+_EMPTY_MAPPING: Dict[tuple, str] = {}
+
+# Only these categories yield fields, so player lookups skip the rest
+_RELEVANT_CATEGORIES = frozenset(_CATEGORY_MAPPINGS)
+
+# Field parsed with _parse_minutes rather than copied as-is
+_MINUTES_FIELD = "minutes"
+
+# player_match_stats.minutes is USMALLINT
+_MAX_MINUTES = 65535
+
+# Leading whole minutes of a value like "90" or "45+2"
+_MINUTES_RE = re.compile(r"^\s*(\d+)")
+
+# Browser-like headers sent with direct match page requests
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+# Match page patterns, compiled once
+_REFEREE_EXTRACT_RE = re.compile(r'Referee:?\s*([^,\n]+)', re.I)
+_ATTENDANCE_EXTRACT_RE = re.compile(r'Attendance:?\s*([\d,]+)', re.I)
+
+_EXSLT_RE = {"re": "http://exslt.org/regular-expressions"}
+
+# First text node mentioning the label, and the scorebox_meta divs as a fallback
+_REFEREE_TEXT_XPATH = etree.XPath("(//text()[re:test(., 'Referee', 'i')])[1]", namespaces=_EXSLT_RE)
+_ATTENDANCE_TEXT_XPATH = etree.XPath("(//text()[re:test(., 'Attendance', 'i')])[1]", namespaces=_EXSLT_RE)
+_SCOREBOX_DIVS_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' scorebox_meta ')]//div"
+)
+
+# Lineup tables: the ones with a "Bench" header row splitting starters from subs
+_LINEUP_TABLES_XPATH = etree.XPath(
+    "//table[.//th[re:test(., 'Bench', 'i')]]",
+    namespaces=_EXSLT_RE,
+)
+_BENCH_HEADER_XPATH = etree.XPath(
+    "th[re:test(., 'Bench', 'i')]",
+    namespaces=_EXSLT_RE,
+)
+
+# Leaf divs of team_stats_extra: each stat is a home / label / away run of siblings
+_TEAM_STAT_CELLS_XPATH = etree.XPath(".//div[not(div)]")
+
+# The two <strong> percentages in the row below the "Possession" header
+_POSSESSION_XPATH = etree.XPath(
+    ".//th[normalize-space()='Possession']/ancestor::tr[1]/following-sibling::tr[1]//strong/text()"
+)
+
+# Per-player tables the match summary helpers never read (dropped while parsing)
+_PRUNED_TABLE_PREFIXES = ("stats_", "keeper_stats_", "shots_")
+
+# Player stats tables read before they are dropped when the page seeds the raw cache
+_PLAYER_TABLE_PREFIXES = ("stats_", "keeper_stats_")
+
+# Player stats table id suffix (stats_<team id>_<suffix>) -> ScraperFC category name
+_HTML_CATEGORIES = {
+    "summary": "Summary",
+    "passing": "Passing",
+    "passing_types": "Passing types",
+    "defense": "Defense",
+    "possession": "Possession",
+    "misc": "Misc",
+}
+
+# Home and away team blocks of the scorebox (each holds the team name and score)
+_SCOREBOX_TEAMS_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' scorebox ')]/div[.//strong/a]"
+)
+_VENUE_DATE_XPATH = etree.XPath("string((//span[contains(@class, 'venuetime')]/@data-venue-date)[1])")
+_COMPETITION_XPATH = etree.XPath(
+    "string((//div[contains(@class, 'scorebox_meta')]//a[contains(@href, '/comps/')])[1])"
+)
+
+# Required fields for a valid player match record
+_REQUIRED_FIELDS = frozenset({"player_name", "minutes", "fouls", "fouled"})
+
+# Fields where a missing value means zero
+_INT_FILL_FIELDS = frozenset({"tackles", "fouls", "fouled"})
+
+# Repetitive string columns dictionary-encoded in Parquet exports (write_batch)
+_DICTIONARY_COLUMNS = ("competition", "venue", "position")
+
+# Characters replaced when a match id becomes a blob file name (write_blobs)
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w-]")
+
+
+@lru_cache(maxsize=64)
+def _player_column_for(columns: tuple):
+    """Return the first column whose name contains 'Player', or None."""
+    return next((col for col in columns if 'Player' in str(col)), None)
+
+
+def _player_column(df) -> Optional[tuple]:
+    """Return the player column of a stats DataFrame (None if absent or empty)."""
+    if not isinstance(df, pd.DataFrame) or df.empty:
+        return None
+    return _player_column_for(tuple(df.columns))
 
 
 class FBrefScraper(BaseScraper):
     """Fixed scraper for FBref data using ScraperFC."""
     
-    def __init__(self):
+    def __init__(self, fbref: Optional["ScraperFCFBref"] = None, names_of_interest: Optional[List[str]] = None,
+                 cache_dir: Optional[str] = None):
+        """Initialize the scraper.
+        
+        Args:
+            fbref: Existing ScraperFC client to reuse (and share its HTTP
+                session); a new one is created if omitted
+            names_of_interest: Players to track across many matches; their
+                names are compiled once into a single matcher
+            cache_dir: Directory for cached ScraperFC results, match pages and
+                match links (defaults to ``FBREF_CACHE_DIR`` or ``data/cache/fbref``)
+        """
         super().__init__()
-        self.fbref = ScraperFCFBref()
+        self.cache_dir = Path(cache_dir or os.getenv("FBREF_CACHE_DIR", "data/cache/fbref"))
+        # Seconds a cached ScraperFC result stays fresh (finished matches rarely change)
+        self.raw_cache_ttl = float(os.getenv("FBREF_RAW_CACHE_TTL", str(30 * 86400)))
+        # Season fixture lists gain links as matches are played, so they expire sooner
+        self.links_cache_ttl = float(os.getenv("FBREF_LINKS_CACHE_TTL", str(7 * 86400)))
+        # Import ScraperFC now so that a missing install fails here, not in a worker
+        self._fbref_cls = type(fbref) if fbref is not None else self._get_fbref_cls()
+        # An injected client is shared as-is; otherwise each thread builds its own
+        self._shared_fbref = fbref
+        self._tls = threading.local()
+        self._name_indexes = {}
+        self._lineup_cache = {}
+        self._team_stats_indexes = {}
+        self._links_cache: Dict[tuple, List[str]] = {}
+        # One keep-alive session for direct page fetches, pooled for parallel scrapes
+        self._session = requests.Session()
+        self._session.headers.update(_BROWSER_HEADERS)
+        # No transport retries: they would bypass _throttle; scrape_with_retry retries instead
+        self._pool = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+        self._mount_pool(self._session)
+        if fbref is not None:
+            self._mount_pool_on_fbref(fbref)
+        self._names_of_interest = {normalize_name(name): name for name in names_of_interest or []}
+        # Longest names first so "cole palmer" wins over a shorter overlapping name
+        self._names_pattern = re.compile("(" + "|".join(
+            re.escape(name) for name in sorted(self._names_of_interest, key=len, reverse=True)
+        ) + ")") if self._names_of_interest else None
         
-    def scrape_match(self, match_url: str, player_name: str = None, **kwargs) -> Dict[str, Any]:
+    @classmethod
+    def _get_fbref_cls(cls):
+        """Import ScraperFC's ``FBref`` (kept out of module import to keep it cheap)."""
+        try:
+            from ScraperFC import FBref as ScraperFCFBref
+        except ImportError:
+            logger.error("ScraperFC not installed. Run: pip install ScraperFC")
+            raise
+        return ScraperFCFBref
+    
+    @property
+    def fbref(self) -> "ScraperFCFBref":
+        """ScraperFC client for the calling thread.
+        
+        ScraperFC keeps per-client session state that is not safe to share
+        between the workers of ``scrape_matches``, so unless a client was
+        injected each thread gets its own, all on the same connection pool.
+        """
+        if self._shared_fbref is not None:
+            return self._shared_fbref
+        fbref = getattr(self._tls, "fbref", None)
+        if fbref is None:
+            fbref = self._tls.fbref = self._new_fbref()
+        return fbref
+    
+    @fbref.setter
+    def fbref(self, fbref: "ScraperFCFBref"):
+        if fbref is not None:
+            self._mount_pool_on_fbref(fbref)
+        self._shared_fbref = fbref
+    
+    def _new_fbref(self) -> "ScraperFCFBref":
+        """Create a ScraperFC client that shares this scraper's connection pool."""
+        fbref = self._fbref_cls()
+        self._mount_pool_on_fbref(fbref)
+        return fbref
+    
+    def _mount_pool(self, session: requests.Session):
+        """Mount the shared keep-alive connection pool on ``session``."""
+        session.mount("https://", self._pool)
+        session.mount("http://", self._pool)
+    
+    def _mount_pool_on_fbref(self, fbref: "ScraperFCFBref"):
+        """Give ScraperFC's own plain session, if it keeps one, the shared pool."""
+        for attr in ("session", "_session"):
+            fbref_session = getattr(fbref, attr, None)
+            if type(fbref_session) is requests.Session:
+                self._mount_pool(fbref_session)
+    
+    def close(self):
+        """Close the HTTP session and its pooled connections."""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
+    def scrape_match(self, match_url: str, player_name: str = None, force_refresh: bool = False,
+                     scraped_at_ns: Optional[int] = None, **kwargs) -> Dict[str, Any]:
         """Scrape FBref match data for a specific player.
         
         Args:
             match_url: FBref match URL
             player_name: Name of the player to extract data for
+            force_refresh: Scrape again even if the match is in the disk cache
+            scraped_at_ns: Scrape timestamp shared by a batch (read now if omitted)
             
         Returns:
             Dictionary containing player match statistics
         """
-        self._wait()
-        
         try:
-            # Scrape the match using ScraperFC
-            match_data = self.fbref.scrape_match(match_url)
+            # Scrape the match using ScraperFC (or reuse an earlier scrape)
+            match_data = self.scrape_raw(match_url, force_refresh=force_refresh)
             
             if match_data is None or match_data.empty:
                 logger.error(f"No data returned for {match_url}")
@@ -46,63 +323,406 @@ class FBrefScraper(BaseScraper):
             
             # Extract player-specific data
             if player_name:
-                player_data = self._extract_player_data(match_data, player_name, match_url)
+                player_data = self._extract_player_data(match_data, player_name, match_url, scraped_at_ns)
                 
                 # TODO: The following fields need to be obtained from other sources:
                 # - starting (whether player started)
                 # - team_fouls, team_fouled
                 # - team_possession_pct, opponent_possession_pct  
                 # - referee_name, attendance
-                # These are not available via ScraperFC and direct HTML scraping is blocked
+                # These are not available via ScraperFC; scrape_matches(page_stats=True)
+                # reads them from the match page
                 
                 return player_data
             else:
                 # Return raw match data if no player specified
-                return self._process_match_data(match_data, match_url)
+                return self._process_match_data(match_data, match_url, scraped_at_ns)
                 
         except Exception as e:
             logger.error(f"Error scraping FBref match {match_url}: {e}")
             raise
     
-    def _extract_player_data(self, match_data: pd.DataFrame, player_name: str, match_url: str) -> Dict[str, Any]:
-        """Extract data for a specific player from match data.
+    def scrape_match_players(self, match_url: str, player_names: List[str], force_refresh: bool = False,
+                             scraped_at_ns: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+        """Scrape a match once and extract several players from it.
+        
+        The match row and its info are unpacked once and each team's name
+        index is shared, so every extra player is only a lookup.
+        
+        Args:
+            match_url: FBref match URL
+            player_names: Names of the players to extract data for
+            force_refresh: Scrape again even if the match is in the disk cache
+            scraped_at_ns: Scrape timestamp shared by a batch (read now if omitted)
+            
+        Returns:
+            Dictionary mapping each requested name to its player statistics
+            (empty if the match could not be scraped)
+        """
+        match_data = self.scrape_raw(match_url, force_refresh=force_refresh)
+        if match_data is None or match_data.empty:
+            logger.error(f"No data returned for {match_url}")
+            return {}
+        
+        row = match_data.iloc[0].to_dict()
+        match_info = self._match_info(row)
+        # One timestamp for the whole match instead of a clock read per player
+        scraped_at_ns = scraped_at_ns or time.time_ns()
+        return {
+            name: self._player_from_row(row, match_info, name, match_url, scraped_at_ns)
+            for name in player_names
+        }
+    
+    def scrape_matches_players(self, players_per_match: Dict[str, List[str]],
+                               max_workers: int = 8) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Scrape many matches in a thread pool, extracting several players from each.
+        
+        Every match is scraped once (see ``scrape_match_players``) and every
+        request goes through the per-host rate limiter, so the pool overlaps
+        network waits without exceeding FBref's budget.
+        
+        Args:
+            players_per_match: Player names to extract, keyed by match URL
+            max_workers: Upper bound on worker threads
+            
+        Returns:
+            ``{match_url: {player_name: stats}}``; a failed match maps to an
+            empty dict instead of aborting the batch
+        """
+        if not players_per_match:
+            return {}
+        
+        results: Dict[str, Dict[str, Dict[str, Any]]] = {url: {} for url in players_per_match}
+        # One scrape timestamp for every record of the batch
+        scraped_at_ns = time.time_ns()
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(players_per_match))) as pool:
+            futures = {
+                pool.submit(self.scrape_match_players, url, names, scraped_at_ns=scraped_at_ns): url
+                for url, names in players_per_match.items()
+            }
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except Exception as e:
+                    logger.error(f"Skipping {url}: {e}")
+        return results
+    
+    def _raw_cache_path(self, match_url: str, full: bool = False) -> Path:
+        """Return the pickle holding a match's ScraperFC result (pruned unless ``full``)."""
+        digest = hashlib.sha256(match_url.encode()).hexdigest()
+        return self.cache_dir / "raw" / f"{digest}{'.full' if full else ''}.pkl"
+    
+    def scrape_raw(self, match_url: str, force_refresh: bool = False,
+                   full: bool = False) -> Optional[pd.DataFrame]:
+        """Return ScraperFC's match DataFrame, scraping only on a cache miss.
+        
+        Results are pickled under ``<cache_dir>/raw`` and reused until
+        ``raw_cache_ttl`` expires, so extracting several players of one match
+        costs a single scrape. By default only the stats this scraper reads
+        are kept (see ``_prune_match_data``); ``full`` keeps ScraperFC's
+        result whole for scripts that inspect it, and a fresh full entry also
+        serves pruned requests.
+        
+        Args:
+            match_url: FBref match URL
+            force_refresh: Ignore any cached result and scrape again
+            full: Return (and cache) every stat category and column
+            
+        Returns:
+            The match DataFrame as returned by ``FBref.scrape_match``
+        """
+        path = self._raw_cache_path(match_url, full=full)
+        candidates = [path] if full else [path, self._raw_cache_path(match_url, full=True)]
+        for cached in candidates:
+            if force_refresh or not self._raw_is_fresh(cached):
+                continue
+            try:
+                match_data = pd.read_pickle(cached)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable cache entry for {match_url}: {e}")
+                continue
+            return match_data if cached == path else self._prune_match_data(match_data)
+        
+        self._throttle(match_url)
+        match_data = self.fbref.scrape_match(match_url)
+        if match_data is not None and not match_data.empty:
+            if not full:
+                match_data = self._prune_match_data(match_data)
+            self._store_raw(path, match_data)
+        return match_data
+    
+    def _raw_is_fresh(self, path: Path) -> bool:
+        """Check whether a raw cache entry exists and is younger than ``raw_cache_ttl``."""
+        return path.exists() and time.time() - path.stat().st_mtime < self.raw_cache_ttl
+    
+    @staticmethod
+    def _store_raw(path: Path, match_data: pd.DataFrame):
+        """Pickle a match DataFrame to a raw cache entry, replacing it atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        match_data.to_pickle(tmp, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(path)
+    
+    @staticmethod
+    def _prune_match_data(match_data: pd.DataFrame) -> pd.DataFrame:
+        """Reduce the nested team stats to the columns this scraper reads.
+        
+        Each team keeps only the mapped categories, each with its player
+        column and mapped columns; scalar match columns are kept as-is. This
+        shrinks cached results several times over.
+        """
+        pruned = match_data.copy()
+        for column in ("Home Player Stats", "Away Player Stats"):
+            if column not in pruned.columns:
+                continue
+            team_stats = pruned.iat[0, pruned.columns.get_loc(column)]
+            if not isinstance(team_stats, pd.Series):
+                continue
+            kept = {}
+            for category, df in team_stats.items():
+                player_col = _player_column(df)
+                if category not in _RELEVANT_CATEGORIES or player_col is None:
+                    continue
+                mapped = [col for col in _CATEGORY_MAPPINGS[category] if col in df.columns]
+                kept[category] = df[[player_col] + mapped]
+            pruned.iat[0, pruned.columns.get_loc(column)] = pd.Series(kept, dtype=object)
+        return pruned
+    
+    def clear_cache(self):
+        """Delete every cached ScraperFC result, match page and match links list."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        self._links_cache.clear()
+    
+    async def scrape_matches_async(self, urls: List[str], player_name: str = None,
+                                   concurrency: int = 4) -> List[Dict[str, Any]]:
+        """Scrape several matches concurrently.
+        
+        ScraperFC is synchronous, so each scrape runs in a worker thread; the
+        semaphore bounds how many are in flight and the per-host rate limiter
+        in ``scrape_match`` keeps the request rate within FBref's budget.
+        
+        Args:
+            urls: FBref match URLs
+            player_name: Name of the player to extract data for (see ``scrape_match``)
+            concurrency: Maximum number of scrapes in flight
+            
+        Returns:
+            One result per URL, in order; failed scrapes yield an empty dict
+        """
+        # One scrape timestamp for every record of the batch
+        scraped_at_ns = time.time_ns()
+        sem = asyncio.Semaphore(concurrency)
+        
+        async def _one(url: str) -> Dict[str, Any]:
+            async with sem:
+                try:
+                    return await asyncio.to_thread(self.scrape_match, url, player_name,
+                                                   scraped_at_ns=scraped_at_ns)
+                except Exception as e:
+                    logger.error(f"Skipping {url}: {e}")
+                    return {}
+        
+        return await asyncio.gather(*(_one(url) for url in urls))
+    
+    def scrape_matches(self, urls: List[str], player_name: str = None, max_workers: int = 8,
+                       page_stats: bool = False) -> List[Dict[str, Any]]:
+        """Scrape several matches in a thread pool.
+        
+        The work is I/O-bound, so threads overlap the network waits; every
+        request still goes through the per-host rate limiter, so the pool
+        never exceeds FBref's request budget.
+        
+        Args:
+            urls: FBref match URLs
+            player_name: Name of the player to extract data for (see ``scrape_match``)
+            max_workers: Number of worker threads
+            page_stats: Also fetch each match page and merge the stats ScraperFC
+                lacks (team fouls, possession, referee, attendance, starting)
+                into the player's record; the page's player tables then
+                stand in for ScraperFC's scrape of the same page on a cache
+                miss (see ``_prefetch_match_page``)
+            
+        Returns:
+            One result per URL, in order; failed scrapes yield an empty dict
+        """
+        # One scrape timestamp for every record of the batch
+        scraped_at_ns = time.time_ns()
+        
+        def _one(url: str) -> Dict[str, Any]:
+            tree = self._prefetch_match_page(url) if page_stats else None
+            data = self.scrape_match(url, player_name, scraped_at_ns=scraped_at_ns)
+            if tree is not None and player_name and data.get("venue"):
+                data.update(self._extract_html_stats(tree, data["venue"], player_name))
+            return data
+        
+        results: List[Dict[str, Any]] = [{} for _ in urls]
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {pool.submit(_one, url): i for i, url in enumerate(urls)}
+            for future in as_completed(futures):
+                i = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Skipping {urls[i]}: {e}")
+        return results
+    
+    def scrape_all_players(self, match_url: str) -> List[Dict[str, Any]]:
+        """Scrape FBref match data for every player of both teams.
+        
+        Args:
+            match_url: FBref match URL
+            
+        Returns:
+            One player statistics dictionary per player, home team first
+        """
+        try:
+            match_data = self.scrape_raw(match_url)
+            if match_data is None or match_data.empty:
+                logger.error(f"No data returned for {match_url}")
+                return []
+            return self._extract_match_players(match_data, match_url)
+        except Exception as e:
+            logger.error(f"Error scraping FBref match {match_url}: {e}")
+            raise
+    
+    def _extract_match_players(self, match_data: pd.DataFrame, match_url: str) -> List[Dict[str, Any]]:
+        """Extract every player's data from match data in one pass per team.
         
         Args:
             match_data: DataFrame from ScraperFC with nested player stats
-            player_name: Name of the player
             match_url: Match URL for reference
             
         Returns:
-            Dictionary with player statistics
+            List of player statistics dictionaries
         """
-        result = {
+        # Plain dict: .get/[] below skip pandas indexing
+        row = match_data.iloc[0].to_dict()
+        base = {
             "match_url": match_url,
-            "player_name": player_name,
-            "scraped_at": datetime.now().isoformat()
+            "scraped_at_ns": time.time_ns(),
+            "date": row.get("Date"),
+            "competition": row.get("Stage", "Unknown"),
+            "home_team": row.get("Home Team"),
+            "away_team": row.get("Away Team"),
+            "home_goals": row.get("Home Goals"),
+            "away_goals": row.get("Away Goals"),
         }
         
+        players = []
+        for venue, column, opponent in (("Home", "Home Player Stats", "Away Team"),
+                                        ("Away", "Away Player Stats", "Home Team")):
+            if column not in match_data.columns:
+                continue
+            wide = self._extract_all_players(row[column])
+            team_info = {**base, "venue": venue, "opponent": row.get(opponent)}
+            players.extend({**team_info, **record} for record in wide.to_dict(orient="records"))
+        
+        logger.info(f"Extracted {len(players)} players from {match_url}")
+        return players
+    
+    def _extract_all_players(self, team_stats: pd.Series) -> pd.DataFrame:
+        """Build one wide DataFrame of mapped fields for all players of a team.
+        
+        Each category is reduced to its player column plus the mapped columns,
+        renamed to our field names, and the categories are outer-merged on
+        ``player_name``.
+        
+        Args:
+            team_stats: Series containing different stat categories
+            
+        Returns:
+            DataFrame with one row per player and one column per mapped field
+        """
+        subs = []
+        for category, df in team_stats.items():
+            player_col = _player_column(df)
+            mappings = _CATEGORY_MAPPINGS.get(category, _EMPTY_MAPPING)
+            present = [col for col in mappings if col in df.columns] if player_col is not None else []
+            if not present:
+                continue
+            sub = df[[player_col] + present]
+            sub.columns = ["player_name"] + [mappings[col] for col in present]
+            subs.append(sub.drop_duplicates("player_name"))
+        
+        if not subs:
+            return pd.DataFrame(columns=["player_name"])
+        
+        wide = reduce(lambda left, right: left.merge(right, on="player_name", how="outer"), subs)
+        return self._clean_fields(wide)
+    
+    def _clean_fields(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """Parse minutes and zero-fill count fields of a frame of mapped fields, column-wise."""
+        if _MINUTES_FIELD in frame.columns:
+            frame[_MINUTES_FIELD] = self._parse_minutes_series(frame[_MINUTES_FIELD])
+        for field in _INT_FILL_FIELDS.intersection(frame.columns):
+            frame[field] = frame[field].fillna(0)
+        return frame
+    
+    def _extract_player_data(self, match_data: pd.DataFrame, player_name: str, match_url: str,
+                             scraped_at_ns: Optional[int] = None) -> Dict[str, Any]:
+        """Extract data for a specific player from match data.
+        
+        Args:
+            match_data: DataFrame from ScraperFC with nested player stats
+            player_name: Name of the player
+            match_url: Match URL for reference
+            scraped_at_ns: Scrape timestamp shared by a batch (read now if omitted)
+            
+        Returns:
+            Dictionary with player statistics
+        """
         if match_data.empty:
             logger.error("Empty match data received")
-            return result
+            return {
+                "match_url": match_url,
+                "player_name": player_name,
+                "scraped_at_ns": scraped_at_ns or time.time_ns()
+            }
         
-        # Extract basic match information from first row
-        row = match_data.iloc[0]
-        result.update({
+        # Plain dict: .get/[] below skip pandas indexing
+        row = match_data.iloc[0].to_dict()
+        return self._player_from_row(row, self._match_info(row), player_name, match_url, scraped_at_ns)
+    
+    @staticmethod
+    def _match_info(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract the basic match information shared by every player of a match."""
+        return {
             "date": row.get("Date"),
             "competition": row.get("Stage", "Unknown"),
             "home_team": row.get("Home Team"),
             "away_team": row.get("Away Team"),
             "home_goals": row.get("Home Goals"),
             "away_goals": row.get("Away Goals"),
-        })
+        }
+    
+    def _player_from_row(self, row: Dict[str, Any], match_info: Dict[str, Any], player_name: str,
+                         match_url: str, scraped_at_ns: Optional[int] = None) -> Dict[str, Any]:
+        """Build one player's record from an already unpacked match row.
+        
+        Args:
+            row: First row of the ScraperFC match DataFrame, as a dict
+            match_info: Result of ``_match_info(row)``
+            player_name: Name of the player
+            match_url: Match URL for reference
+            scraped_at_ns: Timestamp shared by the match's records (read now if omitted)
+            
+        Returns:
+            Dictionary with player statistics
+        """
+        result = {
+            "match_url": match_url,
+            "player_name": player_name,
+            "scraped_at_ns": scraped_at_ns or time.time_ns()
+        }
+        result.update(match_info)
         
         # Find player in home or away stats
         player_found = False
         
         # Check home team stats
-        if "Home Player Stats" in match_data.columns:
-            home_stats = row["Home Player Stats"]
-            player_data = self._find_player_in_team_stats(home_stats, player_name)
+        if "Home Player Stats" in row:
+            player_data = self._find_player_in_team_stats(row["Home Player Stats"], player_name)
             if player_data:
                 result.update(player_data)
                 result["venue"] = "Home"
@@ -110,9 +730,8 @@ class FBrefScraper(BaseScraper):
                 player_found = True
         
         # Check away team stats if not found in home
-        if not player_found and "Away Player Stats" in match_data.columns:
-            away_stats = row["Away Player Stats"]
-            player_data = self._find_player_in_team_stats(away_stats, player_name)
+        if not player_found and "Away Player Stats" in row:
+            player_data = self._find_player_in_team_stats(row["Away Player Stats"], player_name)
             if player_data:
                 result.update(player_data)
                 result["venue"] = "Away"
@@ -138,144 +757,130 @@ class FBrefScraper(BaseScraper):
         """
         player_data = {}
         
-        # Go through each stat category
-        for category in team_stats.index:
-            df = team_stats[category]
-            if not isinstance(df, pd.DataFrame) or df.empty:
-                continue
-                
-            # Find the player column
-            player_col = None
-            for col in df.columns:
-                if 'Player' in str(col):
-                    player_col = col
-                    break
-                    
-            if not player_col:
+        roster, index = self._team_roster(team_stats)
+        key = normalize_name(player_name)
+        hits = index.get(key)
+        if hits is None:
+            # Not an exact name (e.g. a surname only): one substring pass over all
+            # categories, remembered in the index so the next lookup is a dict hit
+            matches = roster[[key in name for name in roster.to_numpy()]]
+            first_per_category = ~matches.index.get_level_values(0).duplicated()
+            hits = index[key] = list(matches.index[first_per_category])
+        
+        for category, position in hits:
+            player_data.update(self._extract_category_rows(team_stats[category], [position], category))
+        
+        return player_data if player_data else None
+    
+    def find_players_of_interest(self, team_stats: pd.Series) -> Dict[str, Dict[str, Any]]:
+        """Extract every tracked player (``names_of_interest``) present in a team.
+        
+        The team's roster is matched against all tracked names in one regex
+        pass instead of one substring scan per name.
+        
+        Args:
+            team_stats: Series containing different stat categories
+            
+        Returns:
+            Dictionary mapping each tracked name found to its player statistics
+        """
+        if self._names_pattern is None:
+            return {}
+        
+        roster, _ = self._team_roster(team_stats)
+        matched = roster.str.extract(self._names_pattern, expand=False).dropna()
+        
+        found, seen = {}, set()
+        for (category, position), key in matched.items():
+            if (key, category) in seen:
                 continue
-                
-            # Look for the player in this category
-            player_rows = df[df[player_col].str.contains(player_name, na=False)]
-            if player_rows.empty:
+            seen.add((key, category))
+            player_data = found.setdefault(self._names_of_interest[key], {})
+            player_data.update(self._extract_category_rows(team_stats[category], [position], category))
+        return found
+    
+    def _team_roster(self, team_stats: pd.Series) -> tuple:
+        """Return a team's concatenated roster and its exact-name index.
+        
+        The roster holds the normalized player names of every mapped category
+        (``_RELEVANT_CATEGORIES``), indexed by ``(category, row position)``; the index maps each name to its
+        ``(category, row position)`` hits. Both are built once per
+        ``team_stats`` object, so looking up every player of a match does not
+        rescan each category.
+        """
+        cached = self._name_indexes.get(id(team_stats))
+        if cached is not None and cached[0] is team_stats:
+            return cached[1]
+        
+        names = {}
+        for category, df in team_stats.items():
+            if category not in _RELEVANT_CATEGORIES:
                 continue
-                
-            # Extract data from this category
-            player_row = player_rows.iloc[0]
-            category_data = self._extract_category_data(player_row, category)
-            player_data.update(category_data)
+            player_col = _player_column(df)
+            if player_col is not None:
+                names[category] = df[player_col].astype(str).map(normalize_name).reset_index(drop=True)
+        roster = pd.concat(names) if names else pd.Series(dtype=str)
         
-        return player_data if player_data else None
+        index = {}
+        for hit, name in roster.items():
+            index.setdefault(name, []).append(hit)
+        
+        if len(self._name_indexes) >= 8:
+            self._name_indexes.clear()
+        self._name_indexes[id(team_stats)] = (team_stats, (roster, index))
+        return roster, index
     
-    def _extract_category_data(self, player_row: pd.Series, category: str) -> Dict[str, Any]:
-        """Extract relevant data from a player row in a specific category.
+    def _extract_category_rows(self, df: pd.DataFrame, rows: List[int], category: str) -> Dict[str, Any]:
+        """Extract relevant data for a player from a specific category.
+        
+        The mapped columns of the selected rows are sliced and renamed in one
+        step, then cleaned column-wise, instead of reading each field from a
+        row Series.
         
         Args:
-            player_row: Player's row data
+            df: Category stats DataFrame
+            rows: Row positions of the player (the first one is used)
             category: Category name (Summary, Misc, Defense, etc.)
             
         Returns:
             Dictionary with extracted data
         """
-        extracted = {}
-        
-        # Define column mappings for each category
-        if category == "Summary":
-            mappings = {
-                ("Unnamed: 5_level_0", "Min"): "minutes",
-                ("Unnamed: 3_level_0", "Pos"): "position",
-                #("Performance", "Gls"): "goals",
-                #("Performance", "Ast"): "assists",
-                #("Performance", "Sh"): "shots",
-                #("Performance", "SoT"): "shots_on_target",
-                ("Performance", "CrdY"): "yellow_cards",
-                ("Performance", "CrdR"): "red_cards",
-                #("Performance", "Touches"): "touches",
-                ("Performance", "Tkl"): "tackles",
-                #("Performance", "Int"): "interceptions",
-                #("Performance", "Blocks"): "blocks",
-            }
-        elif category == "Misc":
-            mappings = {
-                ("Performance", "Fls"): "fouls",
-                ("Performance", "Fld"): "fouled",
-                #("Performance", "Off"): "offsides",
-                #("Performance", "Crs"): "crosses",
-                #("Performance", "TklW"): "tackles_won",
-                #("Performance", "PKwon"): "penalties_won",
-                #("Performance", "PKcon"): "penalties_conceded",
-                #("Performance", "Recov"): "recoveries",
-                #("Aerial Duels", "Won"): "aerial_duels_won",
-                #("Aerial Duels", "Lost"): "aerial_duels_lost",
-            }
-        elif category == "Defense":
-            mappings = {
-                ("Tackles", "Tkl"): "tackles_total",
-                #("Tackles", "TklW"): "tackles_won_def",
-                ("Tackles", "Def 3rd"): "tackles_def_3rd",
-                ("Tackles", "Mid 3rd"): "tackles_mid_3rd",
-                ("Tackles", "Att 3rd"): "tackles_att_3rd",
-                ("Challenges", "Att"): "challenges_attempted",
-                #("Challenges", "Tkl%"): "tackle_success_pct",
-                #("Challenges", "Lost"): "challenges_lost",
-            }
-        elif category == "Possession":
-            mappings = {
-                #("Touches", "Touches"): "touches_total",
-                #("Touches", "Def Pen"): "touches_def_pen",
-                #("Touches", "Def 3rd"): "touches_def_3rd",
-                #("Touches", "Mid 3rd"): "touches_mid_3rd",
-                #("Touches", "Att 3rd"): "touches_att_3rd",
-                #("Touches", "Att Pen"): "touches_att_pen",
-                ("Take-Ons", "Att"): "take_ons_attempted",
-                ("Take-Ons", "Succ"): "take_ons_succeeded",
-                #("Carries", "Carries"): "carries",
-                #("Carries", "PrgC"): "progressive_carries",
-            }
-        else:
-            # For other categories, use a generic mapping
-            mappings = {}
-            
-        # Extract the mapped fields
-        for col_tuple, our_field in mappings.items():
-            if col_tuple in player_row.index:
-                value = player_row[col_tuple]
-                
-                # Handle special cases
-                if our_field == "minutes":
-                    value = self._parse_minutes(value)
-                elif our_field in ["tackles", "fouls", "fouled"] and pd.isna(value):
-                    value = 0
-                    
-                extracted[our_field] = value
+        mappings = _CATEGORY_MAPPINGS.get(category, _EMPTY_MAPPING)
+        cols = [col for col in mappings if col in df.columns]
+        if not cols or not len(rows):
+            return {}
         
-        return extracted
+        sub = df.iloc[rows[:1]][cols]
+        sub.columns = [mappings[col] for col in cols]
+        return self._clean_fields(sub).to_dict(orient="records")[0]
     
     def _parse_minutes(self, minutes_value: Any) -> int:
-        """Parse minutes played from various formats."""
+        """Parse minutes played from various formats, clamped to the USMALLINT column range."""
         if pd.isna(minutes_value):
             return 0
             
         if isinstance(minutes_value, (int, float)):
-            return int(minutes_value)
-            
-        # Handle string formats
-        minutes_str = str(minutes_value)
-        if "+" in minutes_str:
-            # Handle "45+2" format
-            parts = minutes_str.split("+")
-            return int(parts[0])
-        else:
-            try:
-                return int(minutes_str)
-            except ValueError:
-                logger.warning(f"Could not parse minutes: {minutes_str}")
-                return 0
+            return min(max(int(minutes_value), 0), _MAX_MINUTES)
+            
+        # Handle string formats ("90", "45+2" -> 45)
+        match = _MINUTES_RE.match(str(minutes_value))
+        if match is None:
+            logger.warning(f"Could not parse minutes: {minutes_value}")
+            return 0
+        return min(int(match.group(1)), _MAX_MINUTES)
+    
+    @staticmethod
+    def _parse_minutes_series(minutes: pd.Series) -> pd.Series:
+        """Vectorized ``_parse_minutes`` for a whole column ("45+2" -> 45, missing -> 0)."""
+        base = minutes.astype("string").str.extract(_MINUTES_RE, expand=False)
+        return pd.to_numeric(base, errors="coerce").fillna(0).clip(0, _MAX_MINUTES).astype("uint16")
     
-    def _process_match_data(self, match_data: pd.DataFrame, match_url: str) -> Dict[str, Any]:
+    def _process_match_data(self, match_data: pd.DataFrame, match_url: str,
+                            scraped_at_ns: Optional[int] = None) -> Dict[str, Any]:
         """Process raw match data when no specific player is requested."""
         result = {
             "match_url": match_url,
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at_ns": scraped_at_ns or time.time_ns(),
             "data_type": str(type(match_data))
         }
         
@@ -287,185 +892,561 @@ class FBrefScraper(BaseScraper):
     
     def validate_data(self, data: Dict[str, Any]) -> bool:
         """Validate FBref data for required fields."""
-        # Required fields for a valid player match record
-        required_fields = ["player_name", "minutes", "fouls", "fouled"]
+        minutes = data.get("minutes")
+        if minutes is not None and not 0 <= minutes <= 120:
+            logger.warning(f"Invalid minutes value: {minutes}")
+            return False
         
-        missing_fields = []
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                missing_fields.append(field)
-                
+        missing_fields = {field for field in _REQUIRED_FIELDS if data.get(field) is None}
         if missing_fields:
-            logger.warning(f"Missing required fields: {missing_fields}")
+            logger.warning(f"Missing required fields: {sorted(missing_fields)}")
             # Don't fail validation if we have the core data
             if "player_name" in data and "minutes" in data:
                 logger.info("Core fields present, allowing validation to pass")
                 return True
             return False
-                
-        # Additional validation
-        if data.get("minutes", 0) < 0 or data.get("minutes", 0) > 120:
-            logger.warning(f"Invalid minutes value: {data.get('minutes')}")
-            return False
             
         return True
     
-    def get_match_links(self, league: str, season: str) -> List[str]:
-        """Get all match links for a league season."""
+    def flush_batch(self, conn, rows: List[Dict[str, Any]]) -> int:
+        """Insert scraped player rows into ``player_match_stats`` in one statement.
+        
+        The rows are converted to a pyarrow Table with the table's Arrow schema,
+        registered with DuckDB and upserted with a single INSERT OR REPLACE ...
+        SELECT, instead of one INSERT per row; re-scraped matches replace their
+        rows by primary key. Keys that are not table columns are ignored.
+        
+        JSON payloads (heatmap, foul_position, ...) are not stored in the
+        table; pass the same rows to ``write_blobs`` once the transaction
+        has committed, so a rollback leaves no sidecar behind.
+        
+        Args:
+            conn: Open DuckDB connection
+            rows: Player data dicts as returned by ``scrape_match``
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        tbl = self._to_arrow([self._to_db_row(row) for row in rows])
+        columns = ", ".join(tbl.column_names)
+        conn.register("scraped_batch", tbl)
         try:
-            links = self.fbref.get_match_links(league, season)
-            logger.info(f"Found {len(links)} matches for {league} {season}")
-            return links
-        except Exception as e:
-            logger.error(f"Error getting match links: {e}")
-            return []
+            conn.execute(f"INSERT OR REPLACE INTO player_match_stats ({columns}) SELECT {columns} FROM scraped_batch")
+        finally:
+            conn.unregister("scraped_batch")
+        
+        logger.info(f"Inserted {tbl.num_rows} rows into player_match_stats")
+        return tbl.num_rows
+    
+    def _to_arrow(self, db_rows: List[Dict[str, Any]]):
+        """Build a pyarrow Table of ``_to_db_row`` rows with the table's Arrow schema."""
+        import pyarrow as pa
+        
+        return pa.Table.from_pylist(db_rows, schema=player_match_stats_arrow_schema())
+    
+    def write_batch(self, rows: List[Dict[str, Any]], path: str) -> int:
+        """Write scraped player rows to one Parquet file with the table's column types.
+        
+        Low-cardinality strings (competition, venue, position) are
+        dictionary-encoded; the file is zstd-compressed.
+        
+        Args:
+            rows: Player data dicts as returned by ``scrape_match``
+            path: Destination ``.parquet`` file
+            
+        Returns:
+            Number of rows written
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        tbl = self._to_arrow([self._to_db_row(row) for row in rows])
+        for name in _DICTIONARY_COLUMNS:
+            i = tbl.schema.get_field_index(name)
+            tbl = tbl.set_column(i, name, tbl.column(i).cast(pa.dictionary(pa.int16(), pa.string())))
+        
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        pq.write_table(tbl, path, compression="zstd", row_group_size=100_000)
+        logger.info(f"Wrote {tbl.num_rows} rows to {path}")
+        return tbl.num_rows
+    
+    def write_blobs(self, rows: List[Dict[str, Any]]) -> int:
+        """Write the JSON payloads of scraped rows to per-match Parquet sidecars.
+        
+        Each match has one zstd file, ``<match_id>.parquet`` under
+        ``PLAYER_MATCH_BLOBS_DIR`` (env ``BLOBS_DIR``). Rows already in it for
+        the same ``(player_id, match_id)`` are replaced, so re-flushing a
+        match keeps one blob row per table row. Call this only after the
+        transaction that ran ``flush_batch`` on ``rows`` has committed.
+        
+        Args:
+            rows: Player data dicts as returned by ``scrape_match``
+            
+        Returns:
+            Number of blob rows written
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        blob_rows = []
+        for row in rows:
+            if all(row.get(col) is None for col in PLAYER_MATCH_BLOB_COLUMNS):
+                continue
+            db_row = self._to_db_row(row)
+            blob_rows.append({"player_id": db_row["player_id"], "match_id": db_row["match_id"],
+                              **{col: self._to_json(row.get(col)) for col in PLAYER_MATCH_BLOB_COLUMNS}})
+        if not blob_rows:
+            return 0
+        
+        # Fixed schema so that every sidecar reads back the same under one glob
+        schema = pa.schema([(col, pa.string()) for col in ("player_id", "match_id", *PLAYER_MATCH_BLOB_COLUMNS)])
+        blobs_dir = Path(os.getenv("BLOBS_DIR", PLAYER_MATCH_BLOBS_DIR))
+        blobs_dir.mkdir(parents=True, exist_ok=True)
+        for match_id, new in pd.DataFrame(blob_rows).groupby("match_id", sort=False):
+            path = blobs_dir / f"{_UNSAFE_FILENAME_RE.sub('_', str(match_id))}.parquet"
+            if path.exists():
+                new = pd.concat([pq.read_table(path).to_pandas(), new], ignore_index=True)
+            new = new.drop_duplicates(subset=["player_id", "match_id"], keep="last")
+            tmp = path.with_name(path.name + ".tmp")
+            pq.write_table(pa.Table.from_pandas(new, schema=schema, preserve_index=False), tmp, compression="zstd")
+            tmp.replace(path)
+        logger.debug(f"Wrote {len(blob_rows)} blob rows to {blobs_dir}")
+        return len(blob_rows)
+    
+    @staticmethod
+    def _to_json(value: Any) -> Optional[str]:
+        """Serialize a JSON payload once (strings are assumed to be JSON already)."""
+        return value if value is None or isinstance(value, str) else json.dumps(value)
+    
+    def _to_db_row(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Coerce a scraped player dict to the ``player_match_stats`` column types."""
+        import pyarrow as pa
+        
+        row = {}
+        for field in player_match_stats_arrow_schema():
+            value = data.get(field.name)
+            if field.name == "scraped_at" and "scraped_at_ns" in data:
+                value = data["scraped_at_ns"]
+            elif value is None or (not isinstance(value, (list, dict)) and pd.isna(value)):
+                value = None
+            elif pa.types.is_integer(field.type):
+                value = int(value)
+            elif pa.types.is_floating(field.type):
+                value = float(value)
+            elif pa.types.is_decimal(field.type):
+                value = Decimal(str(round(float(value), field.type.scale)))
+            elif pa.types.is_date(field.type) or pa.types.is_timestamp(field.type):
+                value = pd.Timestamp(value)
+                value = value.date() if pa.types.is_date(field.type) else value.to_pydatetime()
+            row[field.name] = value
+        
+        # The primary key is (player_id, match_id); derive both when the scrape lacks them
+        if row["match_id"] is None and data.get("match_url"):
+            parts = data["match_url"].split("/")
+            row["match_id"] = parts[parts.index("matches") + 1] if "matches" in parts else data["match_url"]
+        if row["player_id"] is None:
+            row["player_id"] = row["player_name"]
+        return row
+    
+    def get_match_links(self, league: str, season: str, refresh: bool = False) -> List[str]:
+        """Get all match links for a league season.
+        
+        Results are kept in memory for the scraper's lifetime and on disk as
+        JSON across runs, for ``links_cache_ttl`` seconds; failed lookups are
+        not cached.
+        
+        Args:
+            league: League name as ScraperFC expects it
+            season: Season, e.g. "2023-2024"
+            refresh: Ignore both caches and ask FBref again
+        """
+        key = (league, season)
+        if not refresh and key in self._links_cache:
+            return self._links_cache[key]
+        path = self.cache_dir / "links" / f"{league}_{season}.json".replace(" ", "_")
+        if not refresh and path.exists() and time.time() - path.stat().st_mtime < self.links_cache_ttl:
+            links = json.loads(path.read_text())
+        else:
+            try:
+                links = self.fbref.get_match_links(league, season)
+                logger.info(f"Found {len(links)} matches for {league} {season}")
+            except Exception as e:
+                logger.error(f"Error getting match links: {e}")
+                return []
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(list(links)))
+        self._links_cache[key] = links
+        return links
+    
+    def get_match_links_bulk(self, pairs: List[tuple], max_workers: int = 4) -> Dict[tuple, List[str]]:
+        """Get match links for several (league, season) pairs concurrently.
+        
+        Args:
+            pairs: ``(league, season)`` tuples
+            max_workers: Number of worker threads
+            
+        Returns:
+            Dictionary mapping each pair to its match links
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            links = pool.map(lambda pair: self.get_match_links(*pair), pairs)
+            return dict(zip(pairs, links))
+    
+    # Match page fetching, caching and parsing for scrape_matches(page_stats=True): the page
+    # supplies the stats ScraperFC lacks and, on a raw-cache miss, the player tables as well.
+    
+    def _cache_path(self, url: str) -> Path:
+        """Return the gzip cache file for a page, sharded by the first byte of its hash."""
+        digest = hashlib.sha256(url.encode()).hexdigest()
+        return self.cache_dir / "html" / digest[:2] / f"{digest}.html.gz"
     
-    # The following methods are kept for future use if we implement Selenium or find another way
-    # to get the HTML content. Currently FBref blocks direct requests.
+    @staticmethod
+    def _meta_path(path: Path) -> Path:
+        """Return the ``<hash>.meta.json`` sidecar holding a cached page's validators."""
+        return path.with_name(path.name[:-len(".html.gz")] + ".meta.json")
     
-    def _fetch_match_html(self, match_url: str) -> Optional[str]:
-        """Fetch the HTML content of a match page.
+    @contextmanager
+    def _cache_writer(self, path: Path, response: requests.Response):
+        """Yield a gzip file for ``path``, moved into place only if the block succeeds.
+        
+        Readers never see a partially written page. Pages are stored as the raw
+        bytes FBref serves (UTF-8); the response's ``ETag``/``Last-Modified``
+        go into the sidecar for later conditional requests.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        try:
+            with gzip.open(tmp, "wb") as f:
+                yield f
+            tmp.replace(path)
+            self._meta_path(path).write_text(json.dumps({
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }))
+        finally:
+            tmp.unlink(missing_ok=True)
+    
+    def _conditional_headers(self, path: Path) -> Dict[str, str]:
+        """Return ``If-None-Match``/``If-Modified-Since`` headers for a cached page."""
+        meta_path = self._meta_path(path)
+        if not path.exists() or not meta_path.exists():
+            return {}
+        meta = json.loads(meta_path.read_text())
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+    
+    @staticmethod
+    def _read_cached_tree(path: Path, tables: Optional[Dict[str, pd.DataFrame]] = None) -> lxml.html.HtmlElement:
+        """Parse a cached page straight from its gzip file (see ``_feed_match_html`` for ``tables``)."""
+        with gzip.open(path, "rb") as f:
+            return FBrefScraper._feed_match_html(iter(lambda: f.read(64 * 1024), b""), "utf-8", tables=tables)
+    
+    def _fetch_match_tree(self, match_url: str, revalidate: bool = False,
+                          tables: Optional[Dict[str, pd.DataFrame]] = None) -> Optional[lxml.html.HtmlElement]:
+        """Fetch a match page and parse it while the body is still downloading.
+        
+        Pages in the disk cache are parsed straight from the gzip file.
         
         Args:
             match_url: FBref match URL
+            revalidate: Ask FBref whether a cached page changed (conditional
+                GET) instead of using it as is; a 304 costs no body download
+            tables: If given, filled with the page's player stats tables (see
+                ``_feed_match_html``)
             
         Returns:
-            HTML content as string or None if failed
+            Root element of the parsed page or None if failed
         """
+        path = self._cache_path(match_url)
+        if path.exists() and not revalidate:
+            return self._read_cached_tree(path, tables)
         try:
-            # Add delay to avoid rate limiting
-            import time
-            time.sleep(2)
-            
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1',
-                'Cache-Control': 'max-age=0'
-            }
+            # Shares the per-host budget with the ScraperFC scrapes
+            self._throttle(match_url)
             
-            session = requests.Session()
-            response = session.get(match_url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.text
+            with self._session.get(match_url, stream=True, timeout=self.timeout,
+                                   headers=self._conditional_headers(path)) as response:
+                if response.status_code == 304:
+                    return self._read_cached_tree(path, tables)
+                response.raise_for_status()
+                with self._cache_writer(path, response) as f:
+                    return self._parse_match_html_streaming(response, sink=f.write, tables=tables)
         except Exception as e:
             logger.error(f"Error fetching HTML from {match_url}: {e}")
             return None
     
-    def _extract_additional_stats(self, html: str, venue: str) -> Dict[str, Any]:
+    @staticmethod
+    def _parse_match_html_streaming(response: requests.Response, sink=None,
+                                    tables: Optional[Dict[str, pd.DataFrame]] = None) -> lxml.html.HtmlElement:
+        """Feed a streamed response into lxml chunk by chunk.
+        
+        The page is never held as one decoded string; libxml2 builds the tree
+        incrementally from the raw (already decompressed) bytes.
+        
+        Args:
+            response: Response opened with ``stream=True``
+            sink: Optional callable receiving each raw chunk (e.g. for caching)
+            tables: Optional dict receiving the player stats tables
+            
+        Returns:
+            Root element of the parsed page (see ``_feed_match_html``)
+        """
+        return FBrefScraper._feed_match_html(response.iter_content(64 * 1024), response.encoding, sink, tables)
+    
+    @staticmethod
+    def _feed_match_html(chunks, encoding: Optional[str] = None, sink=None,
+                         tables: Optional[Dict[str, pd.DataFrame]] = None) -> lxml.html.HtmlElement:
+        """Incrementally parse a match page, emptying the player stats tables as they close.
+        
+        The summary helpers only read the scorebox, team stats and lineups, so
+        each ``stats_*``/``keeper_stats_*``/``shots_*`` table is cleared right
+        after it is parsed and the tree stays small. When ``tables`` is given,
+        each ``stats_*``/``keeper_stats_*`` table is first read into it (see
+        ``_parse_stats_table``), so the page can stand in for ScraperFC.
+        
+        Args:
+            chunks: Iterable of raw page bytes
+            encoding: Page encoding, if known
+            sink: Optional callable receiving each raw chunk (e.g. for caching)
+            tables: Optional dict receiving ``{table id: DataFrame}`` in page order
+            
+        Returns:
+            Root element of the parsed page
+        """
+        parser = etree.HTMLPullParser(events=("end",), tag="table", encoding=encoding)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        for chunk in chunks:
+            parser.feed(chunk)
+            if sink is not None:
+                sink(chunk)
+            for _, table in parser.read_events():
+                table_id = table.get("id") or ""
+                if table_id.startswith(_PRUNED_TABLE_PREFIXES):
+                    if tables is not None and table_id.startswith(_PLAYER_TABLE_PREFIXES):
+                        tables[table_id] = FBrefScraper._parse_stats_table(table)
+                    table.clear(keep_tail=True)
+        return parser.close()
+    
+    @staticmethod
+    def _parse_stats_table(table: lxml.html.HtmlElement) -> pd.DataFrame:
+        """Read one player stats ``<table>`` with pandas' lxml reader (the layout ScraperFC returns)."""
+        markup = lxml.html.tostring(table, encoding="unicode")
+        return pd.read_html(io.StringIO(markup), flavor="lxml")[0]
+    
+    @staticmethod
+    def _player_stats_from_tables(tables: Dict[str, pd.DataFrame]) -> Dict[str, pd.Series]:
+        """Group parsed player stats tables per team, like ScraperFC's nested columns.
+        
+        Args:
+            tables: ``{table id: DataFrame}`` in page order (see ``_feed_match_html``)
+            
+        Returns:
+            ``{"Home Player Stats": Series, "Away Player Stats": Series}``, each
+            indexed by category; the home team's tables come first on the page
+        """
+        teams = {}
+        for table_id, df in tables.items():
+            if table_id.startswith("keeper_stats_"):
+                team_id, category = table_id[len("keeper_stats_"):], "Keeper"
+            else:
+                team_id, _, suffix = table_id[len("stats_"):].partition("_")
+                category = _HTML_CATEGORIES.get(suffix)
+                if category is None:
+                    continue
+            teams.setdefault(team_id, {})[category] = df
+        
+        return {
+            column: pd.Series(stats, dtype=object)
+            for column, stats in zip(("Home Player Stats", "Away Player Stats"), teams.values())
+        }
+    
+    def _match_data_from_page(self, match_url: str, tree: lxml.html.HtmlElement,
+                              tables: Dict[str, pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """Build ScraperFC's one-row match DataFrame from an already parsed match page.
+        
+        Args:
+            match_url: FBref match URL
+            tree: Parsed match page (scorebox intact)
+            tables: Its player stats tables (see ``_feed_match_html``)
+            
+        Returns:
+            DataFrame with the match columns this scraper reads and both
+            teams' nested player stats, or None if the page lacks either team
+        """
+        teams = _SCOREBOX_TEAMS_XPATH(tree)
+        player_stats = self._player_stats_from_tables(tables)
+        if len(teams) < 2 or len(player_stats) < 2:
+            return None
+        
+        row: Dict[str, Any] = {"Link": match_url, "Date": _VENUE_DATE_XPATH(tree) or None}
+        competition = _COMPETITION_XPATH(tree).strip()
+        if competition:
+            row["Stage"] = competition
+        for side, team in zip(("Home", "Away"), teams):
+            row[f"{side} Team"] = team.xpath("string(.//strong/a)").strip() or None
+            goals = team.xpath("string(.//div[@class='score'])").strip()
+            row[f"{side} Goals"] = int(goals) if goals.isdigit() else None
+        row.update(player_stats)
+        return pd.DataFrame([row])
+    
+    def _prefetch_match_page(self, match_url: str) -> Optional[lxml.html.HtmlElement]:
+        """Fetch a match page for ``page_stats``, seeding the raw cache from it on a miss.
+        
+        The page carries the same player tables ScraperFC parses. When no
+        fresh ScraperFC result is cached, they are read while the page is
+        parsed and stored as the match's raw result, so the ``scrape_match``
+        that follows does not fetch the same page again through ScraperFC.
+        
+        Args:
+            match_url: FBref match URL
+            
+        Returns:
+            Root element of the parsed page or None if failed
+        """
+        path = self._raw_cache_path(match_url)
+        cached = self._raw_is_fresh(path) or self._raw_is_fresh(self._raw_cache_path(match_url, full=True))
+        tables = None if cached else {}
+        tree = self._fetch_match_tree(match_url, tables=tables)
+        if tree is not None and tables:
+            match_data = self._match_data_from_page(match_url, tree, tables)
+            if match_data is not None:
+                self._store_raw(path, self._prune_match_data(match_data))
+        return tree
+    
+    def _extract_html_stats(self, tree: lxml.html.HtmlElement, venue: str, player_name: str) -> Dict[str, Any]:
+        """Extract everything the match page adds to ScraperFC from one parsed page.
+        
+        Args:
+            tree: Parsed match page (see ``_fetch_match_tree``)
+            venue: "Home" or "Away" to determine which team's stats to use
+            player_name: Name of the player whose starting status to look up
+            
+        Returns:
+            Dictionary with team stats, referee, attendance and ``starting``
+        """
+        stats = self._extract_additional_stats(tree, venue)
+        stats["starting"] = self._extract_starting_status(tree, player_name)
+        return stats
+    
+    def _extract_additional_stats(self, tree: lxml.html.HtmlElement, venue: str) -> Dict[str, Any]:
         """Extract team stats and match info not available in ScraperFC.
         
         Args:
-            html: HTML content of the match page
+            tree: Parsed match page (see ``_fetch_match_tree``)
             venue: "Home" or "Away" to determine which team's stats to use
             
         Returns:
             Dictionary with team stats, referee, attendance
         """
-        soup = BeautifulSoup(html, 'html.parser')
         stats = {}
         
         # Extract team stats from team_stats_extra div
-        team_stats_extra = soup.find('div', {'id': 'team_stats_extra'})
-        if team_stats_extra:
+        team_stats_extra = tree.get_element_by_id('team_stats_extra', None)
+        if team_stats_extra is not None:
+            team_stats_index = self._build_team_stats_index(team_stats_extra)
             # Extract team fouls
-            fouls_data = self._extract_team_stat(team_stats_extra, 'Fouls')
+            fouls_data = team_stats_index.get('Fouls')
             if fouls_data:
                 stats['team_fouls'] = fouls_data[0] if venue == "Home" else fouls_data[1]
                 # Team fouled is the opponent's fouls
                 stats['team_fouled'] = fouls_data[1] if venue == "Home" else fouls_data[0]
         
         # Extract possession from team_stats div
-        team_stats = soup.find('div', {'id': 'team_stats'})
-        if team_stats:
+        team_stats = tree.get_element_by_id('team_stats', None)
+        if team_stats is not None:
             possession_values = self._extract_possession(team_stats)
             if possession_values:
                 stats['team_possession_pct'] = possession_values[0] if venue == "Home" else possession_values[1]
                 stats['opponent_possession_pct'] = possession_values[1] if venue == "Home" else possession_values[0]
         
         # Extract referee
-        referee = self._extract_referee(soup)
+        referee = self._extract_referee(tree)
         if referee:
             stats['referee_name'] = referee
         
         # Extract attendance
-        attendance = self._extract_attendance(soup)
+        attendance = self._extract_attendance(tree)
         if attendance:
             stats['attendance'] = attendance
         
         return stats
     
-    def _extract_team_stat(self, team_stats_div, stat_name: str) -> Optional[tuple]:
-        """Extract a team statistic from the team_stats_extra div.
+    def _build_team_stats_index(self, team_stats_div) -> Dict[str, Tuple[Any, Any]]:
+        """Map every stat label of the team_stats_extra div to its (home, away) values.
+        
+        The div's cells are read in one pass: a non-numeric cell between two
+        numeric siblings is a label, and those siblings are the home and away
+        values. Built once per div, so each stat is a dict lookup.
         
         Args:
-            team_stats_div: BeautifulSoup element containing team stats
-            stat_name: Name of the stat to extract (e.g., "Fouls")
+            team_stats_div: lxml element containing team stats
             
         Returns:
-            Tuple of (home_value, away_value) or None
+            Dictionary like ``{"Fouls": (12, 15)}``
         """
+        cached = self._team_stats_indexes.get(id(team_stats_div))
+        if cached is not None and cached[0] is team_stats_div:
+            return cached[1]
+        
+        index = {}
         try:
-            # Find the div containing the stat name
-            stat_divs = team_stats_div.find_all('div')
-            for i, div in enumerate(stat_divs):
-                if div.text.strip() == stat_name:
-                    # The previous div has home value, next div has away value
-                    home_value = stat_divs[i-1].text.strip() if i > 0 else None
-                    away_value = stat_divs[i+1].text.strip() if i < len(stat_divs)-1 else None
-                    
-                    # Convert to integers if possible
-                    try:
-                        home_value = int(home_value) if home_value else None
-                        away_value = int(away_value) if away_value else None
-                    except ValueError:
-                        pass
-                    
-                    return (home_value, away_value)
+            for cell in _TEAM_STAT_CELLS_XPATH(team_stats_div):
+                label = cell.text_content().strip()
+                if not label or label.isdigit() or label in index:
+                    continue
+                home_div, away_div = cell.getprevious(), cell.getnext()
+                if home_div is None or away_div is None:
+                    continue
+                home_value, away_value = home_div.text_content().strip(), away_div.text_content().strip()
+                if home_value.isdigit() and away_value.isdigit():
+                    index[label] = (int(home_value), int(away_value))
         except Exception as e:
-            logger.warning(f"Error extracting team stat {stat_name}: {e}")
+            logger.warning(f"Error indexing team stats: {e}")
         
-        return None
+        if len(self._team_stats_indexes) >= 8:
+            self._team_stats_indexes.clear()
+        self._team_stats_indexes[id(team_stats_div)] = (team_stats_div, index)
+        return index
     
     def _extract_possession(self, team_stats_div) -> Optional[tuple]:
         """Extract possession percentages from team_stats div.
         
         Args:
-            team_stats_div: BeautifulSoup element containing team stats
+            team_stats_div: lxml element containing team stats
             
         Returns:
             Tuple of (home_possession, away_possession) as floats
         """
         try:
-            # Look for possession section
-            possession_header = team_stats_div.find('th', string='Possession')
-            if possession_header:
-                # Find the row with possession values
-                possession_row = possession_header.find_parent('tr').find_next_sibling('tr')
-                if possession_row:
-                    # Extract percentages from strong tags
-                    strong_tags = possession_row.find_all('strong')
-                    if len(strong_tags) >= 2:
-                        home_pct = strong_tags[0].text.strip().rstrip('%')
-                        away_pct = strong_tags[1].text.strip().rstrip('%')
-                        return (float(home_pct), float(away_pct))
+            texts = _POSSESSION_XPATH(team_stats_div)
+            if len(texts) >= 2:
+                return (float(texts[0].strip().rstrip('%')), float(texts[1].strip().rstrip('%')))
         except Exception as e:
             logger.warning(f"Error extracting possession: {e}")
         
         return None
     
-    def _extract_referee(self, soup) -> Optional[str]:
+    @staticmethod
+    def _text_parent(tree, text_xpath: etree.XPath):
+        """Return the element directly holding the text node selected by ``text_xpath``."""
+        texts = text_xpath(tree)
+        if not texts:
+            return None
+        parent = texts[0].getparent()
+        return parent.getparent() if texts[0].is_tail else parent
+    
+    def _extract_referee(self, tree) -> Optional[str]:
         """Extract referee name from the match page.
         
         Args:
-            soup: BeautifulSoup object of the match page
+            tree: Parsed match page
             
         Returns:
             Referee name or None
@@ -473,113 +1454,103 @@ class FBrefScraper(BaseScraper):
         try:
             # Referee is usually in the match information section
             # Look for "Officials" or "Referee" text
-            referee_element = soup.find(string=re.compile(r'Referee:?\s*', re.I))
-            if referee_element:
-                # The referee name usually follows this text
-                parent = referee_element.parent
-                if parent:
-                    # Extract text after "Referee:"
-                    text = parent.text
-                    match = re.search(r'Referee:?\s*([^,\n]+)', text, re.I)
-                    if match:
-                        return match.group(1).strip()
+            parent = self._text_parent(tree, _REFEREE_TEXT_XPATH)
+            if parent is not None:
+                # Extract text after "Referee:"
+                match = _REFEREE_EXTRACT_RE.search(parent.text_content())
+                if match:
+                    return match.group(1).strip()
                         
             # Alternative: Look in scorebox_meta div
-            scorebox_meta = soup.find('div', {'class': 'scorebox_meta'})
-            if scorebox_meta:
-                for div in scorebox_meta.find_all('div'):
-                    if 'Referee' in div.text:
-                        # Extract name after "Referee:"
-                        match = re.search(r'Referee:?\s*([^,\n]+)', div.text, re.I)
-                        if match:
-                            return match.group(1).strip()
+            for div in _SCOREBOX_DIVS_XPATH(tree):
+                text = div.text_content()
+                if 'Referee' in text:
+                    # Extract name after "Referee:"
+                    match = _REFEREE_EXTRACT_RE.search(text)
+                    if match:
+                        return match.group(1).strip()
         except Exception as e:
             logger.warning(f"Error extracting referee: {e}")
         
         return None
     
-    def _extract_attendance(self, soup) -> Optional[int]:
+    def _extract_attendance(self, tree) -> Optional[int]:
         """Extract attendance from the match page.
         
         Args:
-            soup: BeautifulSoup object of the match page
+            tree: Parsed match page
             
         Returns:
             Attendance number or None
         """
         try:
             # Attendance is usually in the match information section
-            attendance_element = soup.find(string=re.compile(r'Attendance:?\s*', re.I))
-            if attendance_element:
-                parent = attendance_element.parent
-                if parent:
-                    text = parent.text
-                    # Extract number after "Attendance:"
-                    match = re.search(r'Attendance:?\s*([\d,]+)', text, re.I)
+            parent = self._text_parent(tree, _ATTENDANCE_TEXT_XPATH)
+            if parent is not None:
+                # Extract number after "Attendance:"
+                match = _ATTENDANCE_EXTRACT_RE.search(parent.text_content())
+                if match:
+                    # Remove commas and convert to int
+                    attendance_str = match.group(1).replace(',', '')
+                    return int(attendance_str)
+                        
+            # Alternative: Look in scorebox_meta div
+            for div in _SCOREBOX_DIVS_XPATH(tree):
+                text = div.text_content()
+                if 'Attendance' in text:
+                    match = _ATTENDANCE_EXTRACT_RE.search(text)
                     if match:
-                        # Remove commas and convert to int
                         attendance_str = match.group(1).replace(',', '')
                         return int(attendance_str)
-                        
-            # Alternative: Look in scorebox_meta div
-            scorebox_meta = soup.find('div', {'class': 'scorebox_meta'})
-            if scorebox_meta:
-                for div in scorebox_meta.find_all('div'):
-                    if 'Attendance' in div.text:
-                        match = re.search(r'Attendance:?\s*([\d,]+)', div.text, re.I)
-                        if match:
-                            attendance_str = match.group(1).replace(',', '')
-                            return int(attendance_str)
         except Exception as e:
             logger.warning(f"Error extracting attendance: {e}")
         
         return None
     
-    def _extract_starting_status(self, html: str, player_name: str) -> bool:
+    def _parse_lineups(self, tree) -> Tuple[Set[str], Set[str]]:
+        """Return the ``(starters, bench)`` player names of both lineups.
+        
+        Each lineup table is read once, splitting at its Bench header row; the
+        result is memoized per parsed page so every player of a match is a set
+        lookup.
+        """
+        cached = self._lineup_cache.get(id(tree))
+        if cached is not None and cached[0] is tree:
+            return cached[1]
+        
+        starters, bench = set(), set()
+        for table in _LINEUP_TABLES_XPATH(tree):
+            names = starters
+            for row in table.iter('tr'):
+                if _BENCH_HEADER_XPATH(row):
+                    names = bench
+                    continue
+                names.update(name.strip() for name in row.xpath('.//a/text()'))
+        
+        if len(self._lineup_cache) >= 8:
+            self._lineup_cache.clear()
+        self._lineup_cache[id(tree)] = (tree, (starters, bench))
+        return starters, bench
+    
+    def _extract_starting_status(self, tree, player_name: str) -> bool:
         """Determine if a player was in the starting lineup.
         
         Args:
-            html: HTML content of the match page
-            player_name: Name of the player
+            tree: Parsed match page
+            player_name: Name of the player (a partial name such as a surname
+                also matches)
             
         Returns:
             True if player started, False otherwise
         """
-        soup = BeautifulSoup(html, 'html.parser')
-        
         try:
-            # Find lineup tables
-            # Look for tables containing player links
-            lineup_tables = soup.find_all('table')
-            
-            for table in lineup_tables:
-                # Look for "Bench" header to identify lineup table
-                bench_header = table.find('th', string=re.compile(r'Bench', re.I))
-                if bench_header:
-                    # Get all rows before the bench header
-                    all_rows = table.find_all('tr')
-                    bench_row_index = -1
-                    
-                    for i, row in enumerate(all_rows):
-                        if bench_header in row.find_all('th'):
-                            bench_row_index = i
-                            break
-                    
-                    # Check if player is in starting lineup (before bench)
-                    if bench_row_index > 0:
-                        for i in range(bench_row_index):
-                            row = all_rows[i]
-                            # Check if player name is in this row
-                            if player_name in row.text:
-                                logger.debug(f"Found {player_name} in starting lineup")
-                                return True
-                    
-                    # Check if player is on bench (after bench header)
-                    for i in range(bench_row_index + 1, len(all_rows)):
-                        row = all_rows[i]
-                        if player_name in row.text:
-                            logger.debug(f"Found {player_name} on bench")
-                            return False
+            starters, bench = self._parse_lineups(tree)
+            if player_name in starters or any(player_name in name for name in starters):
+                logger.debug(f"Found {player_name} in starting lineup")
+                return True
+            if player_name in bench or any(player_name in name for name in bench):
+                logger.debug(f"Found {player_name} on bench")
+                return False
             
             # If not found in any lineup, log warning
             logger.warning(f"Could not find {player_name} in lineup tables")
@@ -587,4 +1558,4 @@ class FBrefScraper(BaseScraper):
         except Exception as e:
             logger.warning(f"Error determining starting status for {player_name}: {e}")
         
-        return False
\ No newline at end of file
+        return False
@@ -1,25 +1,81 @@
 """FBref scraper using ScraperFC library."""
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
+import re
 import pandas as pd
 from loguru import logger
 
-try:
-    from ScraperFC import FBref as ScraperFCFBref
-except ImportError:
-    logger.error("ScraperFC not installed. Run: pip install ScraperFC")
-    raise
+from .base import BaseScraper, normalize_name
 
-from .base import BaseScraper
+# Map FBref column names to our schema
+_COLUMN_MAPPING = {
+    "Min": "minutes",
+    "Fls": "fouls",
+    "Fld": "fouled",
+    "Tkl": "tackles",
+    "Tkl.1": "tackles_won",  # May need adjustment based on actual columns
+    "Def 3rd": "tackles_def_3rd",
+    "Mid 3rd": "tackles_mid_3rd",
+    "Att 3rd": "tackles_att_3rd",
+    "Tkl%": "tackle_success_pct",
+    "Lost": "challenges_lost",
+    "Blocks": "blocks",
+    "Att": "take_ons_attempted",
+    "Succ": "take_ons_succeeded",
+    "Pos": "position",
+    "Start": "starting",
+}
+
+# Required fields for a valid player match record
+_REQUIRED_FIELDS = frozenset({"player_name", "minutes", "fouls", "fouled"})
+
+# Columns that may hold player names
+_PLAYER_COL_RE = re.compile(r"player|name", re.I)
+
+
+@lru_cache(maxsize=64)
+def _row_extractor(columns: tuple):
+    """Return a function mapping a row's values (in ``columns`` order) to schema fields.
+    
+    The positions of the mapped columns are resolved once per column layout
+    and baked into an ``itemgetter``, so extracting a row does no name lookups.
+    """
+    positions = {col: i for i, col in enumerate(columns)}
+    present = [(positions[col], our_col) for col, our_col in _COLUMN_MAPPING.items() if col in positions]
+    if not present:
+        return lambda values: {}
+    
+    names = tuple(our_col for _, our_col in present)
+    getter = itemgetter(*(i for i, _ in present))
+    if len(present) == 1:
+        return lambda values: {names[0]: getter(values)}
+    return lambda values: dict(zip(names, getter(values)))
 
 
 class FBrefScraper(BaseScraper):
     """Scraper for FBref data using ScraperFC."""
     
+    _fbref_cls = None
+    
+    @classmethod
+    def _get_fbref_cls(cls):
+        """Import ScraperFC's ``FBref`` on first use and keep it on the class."""
+        if cls._fbref_cls is None:
+            try:
+                from ScraperFC import FBref as ScraperFCFBref
+            except ImportError:
+                logger.error("ScraperFC not installed. Run: pip install ScraperFC")
+                raise
+            cls._fbref_cls = ScraperFCFBref
+        return cls._fbref_cls
+    
     def __init__(self):
         super().__init__()
-        self.fbref = ScraperFCFBref()
+        self.fbref = self._get_fbref_cls()()
+        self._player_indexes = {}
         
     def scrape_match(self, match_url: str, player_name: str = None, **kwargs) -> Dict[str, Any]:
         """Scrape FBref match data for a specific player.
@@ -75,7 +131,8 @@ class FBrefScraper(BaseScraper):
             return result
         
         # Extract basic match information from first row
-        row = match_data.iloc[0]
+        # Plain dict: .get/[] below skip pandas indexing
+        row = match_data.iloc[0].to_dict()
         result.update({
             "date": row.get("Date"),
             "competition": "Premier League",  # Could extract from Stage column
@@ -89,7 +146,7 @@ class FBrefScraper(BaseScraper):
         player_found = False
         
         # Check home team stats
-        if "Home Player Stats" in match_data.columns:
+        if "Home Player Stats" in row:
             home_stats = row["Home Player Stats"]
             if isinstance(home_stats, pd.DataFrame):
                 player_row = self._find_player_in_stats(home_stats, player_name)
@@ -100,7 +157,7 @@ class FBrefScraper(BaseScraper):
                     player_found = True
         
         # Check away team stats if not found in home
-        if not player_found and "Away Player Stats" in match_data.columns:
+        if not player_found and "Away Player Stats" in row:
             away_stats = row["Away Player Stats"]
             if isinstance(away_stats, pd.DataFrame):
                 player_row = self._find_player_in_stats(away_stats, player_name)
@@ -128,25 +185,53 @@ class FBrefScraper(BaseScraper):
         if player_stats.empty:
             return None
             
-        # Look for common player column names
-        player_cols = [col for col in player_stats.columns if 'player' in col.lower() or 'name' in col.lower()]
+        index, normalized_index = self._build_player_index(player_stats)
+        # Exact name first, then ignoring case and accents ("Cole Palmér")
+        position = index.get(player_name)
+        if position is None:
+            position = normalized_index.get(normalize_name(player_name))
+        if position is not None:
+            return player_stats.iloc[position]
+                
+        # Lazy: the column list and sample rows are only built if debug is enabled
+        logger.opt(lazy=True).debug("Available columns in player stats: {}", lambda: list(player_stats.columns))
+        logger.opt(lazy=True).debug("Sample player names: {}", lambda: player_stats.iloc[:3].to_dict())
+            
+        return None
+    
+    def _build_player_index(self, player_stats: pd.DataFrame) -> Tuple[Dict[str, int], Dict[str, int]]:
+        """Map every player name of a stats DataFrame to its row position.
+        
+        Names come from the columns mentioning "player"/"name", then "Player",
+        the first hit winning as in a scan of those columns. The index is
+        built once per DataFrame, so each further lookup is a dict hit.
         
-        for col in player_cols:
-            matches = player_stats[player_stats[col] == player_name]
-            if not matches.empty:
-                return matches.iloc[0]
+        Returns:
+            ``(index, normalized_index)``: keyed by the exact names, and by
+            names with accents stripped and case folded
+        """
+        cached = self._player_indexes.get(id(player_stats))
+        if cached is not None and cached[0] is player_stats:
+            return cached[1]
         
+        # Look for common player column names
+        player_cols = [col for col in player_stats.columns if _PLAYER_COL_RE.search(col)]
         # Also try direct column name "Player" if it exists
         if "Player" in player_stats.columns:
-            matches = player_stats[player_stats["Player"] == player_name]
-            if not matches.empty:
-                return matches.iloc[0]
-                
-        logger.debug(f"Available columns in player stats: {list(player_stats.columns)}")
-        if not player_stats.empty:
-            logger.debug(f"Sample player names: {player_stats.iloc[:3].to_dict()}")
-            
-        return None
+            player_cols.append("Player")
+        
+        # Built from the last column and row backwards, so earlier hits overwrite later ones
+        positions = range(len(player_stats) - 1, -1, -1)
+        index, normalized_index = {}, {}
+        for col in reversed(player_cols):
+            names = player_stats[col].tolist()[::-1]
+            index.update(zip(names, positions))
+            normalized_index.update(zip(map(normalize_name, names), positions))
+        
+        if len(self._player_indexes) >= 8:
+            self._player_indexes.clear()
+        self._player_indexes[id(player_stats)] = (player_stats, (index, normalized_index))
+        return index, normalized_index
     
     def _extract_player_row(self, player_row: pd.Series) -> Dict[str, Any]:
         """Extract relevant statistics from a player's row.
@@ -157,37 +242,14 @@ class FBrefScraper(BaseScraper):
         Returns:
             Dictionary with extracted statistics
         """
-        # Map FBref column names to our schema
-        column_mapping = {
-            "Min": "minutes",
-            "Fls": "fouls",
-            "Fld": "fouled",
-            "Tkl": "tackles",
-            "Tkl.1": "tackles_won",  # May need adjustment based on actual columns
-            "Def 3rd": "tackles_def_3rd",
-            "Mid 3rd": "tackles_mid_3rd",
-            "Att 3rd": "tackles_att_3rd",
-            "Tkl%": "tackle_success_pct",
-            "Lost": "challenges_lost",
-            "Blocks": "blocks",
-            "Att": "take_ons_attempted",
-            "Succ": "take_ons_succeeded",
-            "Pos": "position",
-            "Start": "starting",
-        }
+        extracted = _row_extractor(tuple(player_row.index))(player_row.tolist())
         
-        extracted = {}
-        for fbref_col, our_col in column_mapping.items():
-            if fbref_col in player_row:
-                value = player_row[fbref_col]
-                # Handle different data types
-                if our_col == "starting":
-                    extracted[our_col] = value == "Y" or value == True
-                elif our_col == "minutes":
-                    # Handle substitution notation (e.g., "90" or "45+2")
-                    extracted[our_col] = self._parse_minutes(value)
-                else:
-                    extracted[our_col] = value
+        # Handle different data types
+        if "starting" in extracted:
+            extracted["starting"] = extracted["starting"] == "Y" or extracted["starting"] == True
+        if "minutes" in extracted:
+            # Handle substitution notation (e.g., "90" or "45+2")
+            extracted["minutes"] = self._parse_minutes(extracted["minutes"])
                     
         return extracted
     
@@ -251,17 +313,18 @@ class FBrefScraper(BaseScraper):
         Returns:
             True if data contains minimum required fields
         """
-        # Required fields for a valid player match record
-        required_fields = ["player_name", "minutes", "fouls", "fouled"]
-        
-        for field in required_fields:
-            if field not in data or data[field] is None:
-                logger.warning(f"Missing required field: {field}")
-                return False
+        # Set difference runs in C; None values count as missing too
+        missing = _REQUIRED_FIELDS - data.keys()
+        if not missing:
+            missing = {field for field in _REQUIRED_FIELDS if data[field] is None}
+        if missing:
+            logger.warning(f"Missing required fields: {sorted(missing)}")
+            return False
                 
         # Additional validation
-        if data.get("minutes", 0) < 0 or data.get("minutes", 0) > 120:
-            logger.warning(f"Invalid minutes value: {data.get('minutes')}")
+        minutes = data["minutes"]
+        if not 0 <= minutes <= 120:
+            logger.warning(f"Invalid minutes value: {minutes}")
             return False
             
         return True
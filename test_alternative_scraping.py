@@ -4,15 +4,16 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-from ScraperFC import FBref as ScraperFCFBref
 import pandas as pd
 from loguru import logger
 import time
 
+from scripts._fbref_client import get_fbref
+
 def test_scraperfc_capabilities():
     """Test what else ScraperFC can provide."""
     
-    fbref = ScraperFCFBref()
+    fbref = get_fbref()
     
     logger.info("Testing ScraperFC capabilities...")
     
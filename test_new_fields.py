@@ -4,12 +4,13 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-import json
 from datetime import datetime
 from loguru import logger
 
 from src.scrapers.fbref import FBrefScraper
 from src.data.database import init_database
+from scripts._fbref_client import get_fbref
+from scripts._json_out import write_json
 
 def test_cole_palmer_match():
     """Test extraction of all fields for Cole Palmer match."""
@@ -19,7 +20,7 @@ def test_cole_palmer_match():
     init_database()
     
     # Create scraper
-    scraper = FBrefScraper()
+    scraper = FBrefScraper(fbref=get_fbref())
     
     # Test match data
     match_url = "https://fbref.com/en/matches/b9e00aac/Chelsea-Nottingham-Forest-October-6-2024-Premier-League"
@@ -85,14 +86,13 @@ def test_cole_palmer_match():
         else:
             logger.error(f"\n❌ Missing new fields: {missing_new_fields}")
         
-        # Save to JSON for inspection
-        output_file = f"data/samples/test_new_fields_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        # Save the full record for inspection, plus the row as the table would store it
+        output_base = f"data/samples/test_new_fields_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        write_json(player_data, f"{output_base}.json")
+        scraper.write_batch([player_data], f"{output_base}.parquet")
         
-        with open(output_file, 'w') as f:
-            json.dump(player_data, f, indent=2, default=str)
-        
-        logger.success(f"\nFull data saved to {output_file}")
+        logger.success(f"\nFull data saved to {output_base}.json")
+        logger.info(f"player_match_stats row saved to {output_base}.parquet")
         
         # Summary statistics
         logger.info("\n" + "=" * 60)